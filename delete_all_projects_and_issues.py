@@ -13,11 +13,8 @@ from src.services.project_management_service import ProjectManagementService
 from src.domain.resource_types import ResourceStatus
 
 
-async def delete_all_projects():
+async def delete_all_projects(service: ProjectManagementService):
     """Delete all projects."""
-    print(f"Connecting to GitHub repository: {GITHUB_OWNER}/{GITHUB_REPO}")
-    service = ProjectManagementService(GITHUB_OWNER, GITHUB_REPO, GITHUB_TOKEN)
-    
     # List all projects (both active and closed)
     print("\n📋 Listing all projects...")
     active_projects = await service.list_projects(status=ResourceStatus.ACTIVE)
@@ -59,10 +56,9 @@ async def delete_all_projects():
         print(f"❌ Failed to delete {failed_count} project(s).")
 
 
-async def close_all_issues():
+async def close_all_issues(service: ProjectManagementService):
     """Close all open issues."""
     print(f"\n📋 Listing all open issues...")
-    service = ProjectManagementService(GITHUB_OWNER, GITHUB_REPO, GITHUB_TOKEN)
     
     # List all open issues
     open_issues = await service.list_issues(options={"status": "open"})
@@ -109,12 +105,15 @@ async def main():
     print("GitHub Project and Issue Cleanup Script")
     print("=" * 60)
     
+    print(f"Connecting to GitHub repository: {GITHUB_OWNER}/{GITHUB_REPO}")
+    service = ProjectManagementService.get(GITHUB_OWNER, GITHUB_REPO, GITHUB_TOKEN)
+    
     try:
         # Delete all projects
-        await delete_all_projects()
+        await delete_all_projects(service)
         
         # Close all issues
-        await close_all_issues()
+        await close_all_issues(service)
         
         print("\n" + "=" * 60)
         print("✅ Cleanup completed!")
@@ -125,6 +124,9 @@ async def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Close the pooled GitHub HTTP connections
+        await service.aclose()
 
 
 if __name__ == "__main__":
@@ -186,6 +186,9 @@ class GitHubProjectManagerServer:
         except Exception as error:
             self.logger.error(f"Failed to start server: {error}")
             raise
+        finally:
+            # Close the pooled GitHub HTTP connections on shutdown
+            await self.service.aclose()
 
 
 def main():
@@ -1,6 +1,7 @@
 """GitHub repository factory."""
 
 from typing import Optional, Dict, Any
+import httpx
 from github import Github
 from .github_config import GitHubConfig
 from .github_error_handler import GitHubErrorHandler
@@ -72,6 +73,16 @@ class GitHubRepositoryFactory:
         if options is None:
             options = RepositoryFactoryOptions()
         self.options = options
+        
+        # One pooled HTTP client shared by every repository's GraphQL calls,
+        # so connections and TLS sessions are reused across requests
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self.http_client.aclose()
     
     def get_error_handler(self) -> GitHubErrorHandler:
         """Get error handler."""
@@ -83,19 +94,19 @@ class GitHubRepositoryFactory:
     
     def create_project_repository(self) -> GitHubProjectRepository:
         """Create project repository."""
-        return GitHubProjectRepository(self.github, self.repo, self.config)
+        return GitHubProjectRepository(self.github, self.repo, self.config, self.http_client)
     
     def create_issue_repository(self) -> GitHubIssueRepository:
         """Create issue repository."""
-        return GitHubIssueRepository(self.github, self.repo, self.config)
+        return GitHubIssueRepository(self.github, self.repo, self.config, self.http_client)
     
     def create_milestone_repository(self) -> GitHubMilestoneRepository:
         """Create milestone repository."""
-        return GitHubMilestoneRepository(self.github, self.repo, self.config)
+        return GitHubMilestoneRepository(self.github, self.repo, self.config, self.http_client)
     
     def create_sprint_repository(self) -> GitHubSprintRepository:
         """Create sprint repository."""
-        return GitHubSprintRepository(self.github, self.repo, self.config)
+        return GitHubSprintRepository(self.github, self.repo, self.config, self.http_client)
     
     @classmethod
     def create(
@@ -27,6 +27,17 @@ def map_to_graphql_view_layout(layout: ViewLayout) -> GraphQLViewLayout:
     return mapping.get(layout, 'BOARD_LAYOUT')
 
 
+def map_from_graphql_view_layout(layout: GraphQLViewLayout) -> ViewLayout:
+    """Map GitHub GraphQL layout to domain view layout."""
+    mapping = {
+        'BOARD_LAYOUT': 'board',
+        'TABLE_LAYOUT': 'table',
+        'TIMELINE_LAYOUT': 'timeline',
+        'ROADMAP_LAYOUT': 'roadmap'
+    }
+    return mapping.get(layout, 'board')
+
+
 def map_to_graphql_field_type(field_type: FieldType) -> GraphQLFieldType:
     """Map domain field type to GitHub GraphQL field type."""
     mapping = {
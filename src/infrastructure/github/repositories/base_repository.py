@@ -1,7 +1,8 @@
 """Base GitHub repository."""
 
 import asyncio
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, AsyncIterator, Dict, Optional, Protocol, Tuple
+import httpx
 from github import Github
 from github.Repository import Repository
 from ..github_config import GitHubConfig
@@ -31,7 +32,8 @@ class BaseGitHubRepository:
         self,
         github: Github,
         repo: Repository,
-        config: GitHubConfig
+        config: GitHubConfig,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """Initialize base repository."""
         self._github = github
@@ -40,7 +42,7 @@ class BaseGitHubRepository:
         self._error_handler = GitHubErrorHandler()
         self._retry_attempts = 3
         self._logger = get_logger(self.__class__.__name__)
-        self._graphql_client = GraphQLClient(config)
+        self._graphql_client = GraphQLClient(config, http_client)
     
     @property
     def github(self) -> Github:
@@ -113,9 +115,34 @@ class BaseGitHubRepository:
             return items
         return items[:limit]
     
-    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Any:
-        """Execute GraphQL query with rate limiting support."""
+    async def _iter_pages(self, paginated) -> AsyncIterator[list]:
+        """Yield a PyGithub PaginatedList one REST page at a time.
+        
+        Each page request runs in a worker thread so the event loop is free
+        while it is in flight.
+        """
+        per_page = self._github.per_page
+        page_number = 0
+        while True:
+            page = await asyncio.to_thread(paginated.get_page, page_number)
+            if page:
+                yield page
+            if len(page) < per_page:
+                # A short (or empty) page is the last one
+                return
+            page_number += 1
+    
+    async def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        nullable_errors: Tuple[str, ...] = ()
+    ) -> Any:
+        """Execute GraphQL query with rate limiting support.
+        
+        See GraphQLClient.execute for nullable_errors.
+        """
         async def _execute():
-            return await self._graphql_client.execute(query, variables)
+            return await self._graphql_client.execute(query, variables, nullable_errors)
         return await self.with_retry(_execute, 'executing GraphQL query')
 
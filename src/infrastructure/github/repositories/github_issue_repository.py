@@ -1,8 +1,9 @@
 """GitHub issue repository."""
 
+import asyncio
 import json
 import traceback
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List
 from github import Github
 from github.Repository import Repository
 from ..github_config import GitHubConfig
@@ -11,10 +12,32 @@ from ....domain.types import Issue, CreateIssue, IssueId, MilestoneId, IssueComm
 from ....domain.resource_types import ResourceStatus
 import httpx
 
+# Issue selection shared by the aliased GraphQL lookups below. GitHub caps
+# assignees at 10 per issue, so asking for more only inflates the query's
+# node cost (GitHub rejects queries costing over 500,000 nodes)
+_ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+  number
+  title
+  body
+  state
+  url
+  createdAt
+  updatedAt
+  milestone { number }
+  assignees(first: 10) { nodes { login } }
+  labels(first: 100) { nodes { name } }
+}
+"""
+
 
 class GitHubIssueRepository(BaseGitHubRepository):
     """GitHub issue repository."""
     
+    # Most aliased issue listings sent in one find_all_batched query; a full
+    # batch costs 25 * (100 + 100 * (10 + 100)) = 277,500 nodes
+    MAX_BATCH_QUERIES = 25
+    
     async def _create_issue_via_api(self, data: CreateIssue) -> Issue:
         """Create issue using direct GitHub API call as fallback."""
         try:
@@ -265,14 +288,74 @@ class GitHubIssueRepository(BaseGitHubRepository):
         except Exception:
             return None
     
+    async def find_by_ids(self, ids: List[IssueId]) -> List[Issue]:
+        """Find several issues by ID in a single GraphQL request.
+        
+        Issues are returned in input order; IDs that are not issue numbers
+        or that don't resolve to an issue are skipped.
+        """
+        numbers = []
+        for id in ids:
+            try:
+                numbers.append(int(id))
+            except (TypeError, ValueError):
+                continue
+        if not numbers:
+            return []
+        
+        # One aliased issue(number:) lookup per ID, all in the same query
+        variables = {"owner": self._config.owner, "repo": self._config.repo}
+        declarations = ["$owner: String!", "$repo: String!"]
+        selections = []
+        for index, number in enumerate(numbers):
+            variables[f"n{index}"] = number
+            declarations.append(f"$n{index}: Int!")
+            selections.append(f"i{index}: issue(number: $n{index}) {{ ...IssueFields }}")
+        
+        query = f"""
+        query({", ".join(declarations)}) {{
+          repository(owner: $owner, name: $repo) {{
+            {" ".join(selections)}
+          }}
+        }}
+        """ + _ISSUE_FIELDS_FRAGMENT
+        
+        try:
+            # Numbers that aren't issues (pull requests, deleted or transferred
+            # issues) come back as a null alias plus a per-alias error; those
+            # are just skipped below
+            response = await self.graphql(
+                query, variables, nullable_errors=("Could not resolve to an Issue",)
+            )
+        except Exception as e:
+            # Transport or other fatal errors; look the issues up one by one
+            # so whatever can be found is still returned
+            self._logger.warn(f"Batch issue lookup failed, fetching individually: {str(e)}")
+            found = [await self.find_by_id(number) for number in numbers]
+            return [issue for issue in found if issue]
+        
+        repository = response.get("repository") or {}
+        issues = []
+        for index in range(len(numbers)):
+            node = repository.get(f"i{index}")
+            if node:
+                issues.append(self._convert_graphql_issue(node))
+        return issues
+    
     async def find_by_milestone(self, milestone_id: MilestoneId) -> List[Issue]:
         """Find issues by milestone."""
-        try:
+        def _fetch() -> List[Issue]:
             # PyGithub expects milestone as an integer or milestone object
-            milestone_number = int(milestone_id)
             milestone_obj = self.repo.get_milestone(milestone_number)
-            issues = self.repo.get_issues(milestone=milestone_obj)
+            # Open and closed alike, so milestone progress can be derived from it
+            issues = self.repo.get_issues(milestone=milestone_obj, state='all')
             return [self._convert_issue(issue) for issue in issues]
+        
+        try:
+            milestone_number = int(milestone_id)
+            # PyGithub blocks (once per page), so keep it off the event loop
+            # and let concurrent milestone lookups actually overlap
+            return await asyncio.to_thread(_fetch)
         except (ValueError, TypeError) as e:
             # If milestone_id is not a valid integer, return empty list
             return []
@@ -282,19 +365,98 @@ class GitHubIssueRepository(BaseGitHubRepository):
                 self._logger.warn(f"Failed to get issues for milestone {milestone_id}: {str(e)}")
             return []
     
-    async def find_all(self, options: Optional[dict] = None) -> List[Issue]:
-        """Find all issues."""
+    @staticmethod
+    def _state_filter(options: Optional[dict]) -> str:
+        """Map the status option to a REST issue state filter."""
         state = options.get('status') if options else None
         if state == ResourceStatus.CLOSED:
-            state = 'closed'
+            return 'closed'
         elif state == ResourceStatus.ACTIVE:
-            state = 'open'
-        else:
-            state = 'all'
-        
-        issues = self.repo.get_issues(state=state)
+            return 'open'
+        return 'all'
+    
+    async def find_all(self, options: Optional[dict] = None) -> List[Issue]:
+        """Find all issues."""
+        issues = self.repo.get_issues(state=self._state_filter(options))
         return [self._convert_issue(issue) for issue in issues]
     
+    def _issue_filters(self, options: Optional[dict]) -> dict:
+        """Map issue list options to a GraphQL IssueFilters input."""
+        filters: dict = {}
+        state = self._state_filter(options)
+        if state != 'all':
+            filters['states'] = ['CLOSED' if state == 'closed' else 'OPEN']
+        if options:
+            if options.get('milestone'):
+                filters['milestoneNumber'] = str(options['milestone'])
+            if options.get('labels'):
+                filters['labels'] = list(options['labels'])
+            if options.get('assignee'):
+                filters['assignee'] = options['assignee']
+        return filters
+    
+    async def find_all_batched(self, option_sets: List[Optional[dict]]) -> List[List[Issue]]:
+        """Run several issue listings in one aliased GraphQL query.
+        
+        Each option set supports status, milestone, labels and assignee,
+        and results come back in input order, newest first. Listings that
+        run past one page are continued together in follow-up queries.
+        At most MAX_BATCH_QUERIES option sets may be passed. Unlike
+        find_all, pull requests are not included.
+        """
+        if len(option_sets) > self.MAX_BATCH_QUERIES:
+            raise ValueError(f"At most {self.MAX_BATCH_QUERIES} option sets can be batched")
+        
+        filters = [self._issue_filters(options) for options in option_sets]
+        results: List[List[Issue]] = [[] for _ in option_sets]
+        # Listing index -> cursor to continue from (None for the first page)
+        pending: Dict[int, Optional[str]] = dict.fromkeys(range(len(option_sets)))
+        
+        while pending:
+            variables: Dict[str, Any] = {"owner": self._config.owner, "repo": self._config.repo}
+            declarations = ["$owner: String!", "$repo: String!"]
+            selections = []
+            for index, cursor in pending.items():
+                variables[f"f{index}"] = filters[index]
+                variables[f"a{index}"] = cursor
+                declarations.append(f"$f{index}: IssueFilters")
+                declarations.append(f"$a{index}: String")
+                selections.append(
+                    f"q{index}: issues(first: 100, after: $a{index}, filterBy: $f{index}, "
+                    f"orderBy: {{field: CREATED_AT, direction: DESC}}) {{ "
+                    f"pageInfo {{ hasNextPage endCursor }} nodes {{ ...IssueFields }} }}"
+                )
+            
+            query = f"""
+            query({", ".join(declarations)}) {{
+              repository(owner: $owner, name: $repo) {{
+                {" ".join(selections)}
+              }}
+            }}
+            """ + _ISSUE_FIELDS_FRAGMENT
+            
+            response = await self.graphql(query, variables)
+            repository = response.get("repository") or {}
+            
+            next_pending: Dict[int, Optional[str]] = {}
+            for index in pending:
+                connection = repository.get(f"q{index}") or {}
+                results[index].extend(
+                    self._convert_graphql_issue(node) for node in connection.get("nodes") or []
+                )
+                page_info = connection.get("pageInfo") or {}
+                if page_info.get("hasNextPage"):
+                    next_pending[index] = page_info.get("endCursor")
+            pending = next_pending
+        
+        return results
+    
+    async def find_pages(self, options: Optional[dict] = None) -> AsyncIterator[List[Issue]]:
+        """Find all issues, yielded one page at a time."""
+        paginated = self.repo.get_issues(state=self._state_filter(options))
+        async for page in self._iter_pages(paginated):
+            yield [self._convert_issue(issue) for issue in page]
+    
     async def search(self, query: str) -> List[Issue]:
         """Search issues using GitHub search API query syntax.
         
@@ -348,6 +510,26 @@ class GitHubIssueRepository(BaseGitHubRepository):
             url=issue.html_url
         )
     
+    def _convert_graphql_issue(self, node: dict) -> Issue:
+        """Convert a GraphQL issue node to domain Issue.
+        
+        Timestamps are normalized to the same +00:00 form as _convert_issue.
+        """
+        milestone = node.get("milestone")
+        return Issue(
+            id=str(node["number"]),
+            number=node["number"],
+            title=node.get("title", ""),
+            description=node.get("body") or "",
+            status=ResourceStatus.CLOSED if node.get("state") == "CLOSED" else ResourceStatus.ACTIVE,
+            assignees=[a["login"] for a in (node.get("assignees") or {}).get("nodes") or []],
+            labels=[l["name"] for l in (node.get("labels") or {}).get("nodes") or []],
+            milestone_id=str(milestone["number"]) if milestone else None,
+            created_at=(node.get("createdAt") or "").replace("Z", "+00:00"),
+            updated_at=(node.get("updatedAt") or "").replace("Z", "+00:00"),
+            url=node.get("url", "")
+        )
+    
     def _convert_comment(self, comment) -> IssueComment:
         """Convert GitHub comment to domain IssueComment."""
         return IssueComment(
@@ -1,5 +1,6 @@
 """GitHub milestone repository."""
 
+import asyncio
 from typing import Optional, List
 from github import Github
 from github.Repository import Repository
@@ -8,6 +9,17 @@ from .base_repository import BaseGitHubRepository
 from ....domain.types import Milestone, CreateMilestone, MilestoneId
 from ....domain.resource_types import ResourceStatus
 
+# Sort fields GET /milestones accepts, keyed by the spellings callers use;
+# anything else is dropped rather than sent (GitHub rejects it)
+_MILESTONE_SORTS = {
+    'due_on': 'due_on',
+    'due_date': 'due_on',
+    'duedate': 'due_on',
+    'due': 'due_on',
+    'completeness': 'completeness',
+}
+_MILESTONE_DIRECTIONS = {'asc', 'desc'}
+
 
 class GitHubMilestoneRepository(BaseGitHubRepository):
     """GitHub milestone repository."""
@@ -78,7 +90,9 @@ class GitHubMilestoneRepository(BaseGitHubRepository):
     async def find_by_id(self, id: MilestoneId) -> Optional[Milestone]:
         """Find milestone by ID."""
         try:
-            milestone = self.repo.get_milestone(int(id))
+            # Blocking PyGithub call; run it in a thread so it can overlap
+            # with other requests (e.g. the milestone's issue listing)
+            milestone = await asyncio.to_thread(self.repo.get_milestone, int(id))
             return self._convert_milestone(milestone)
         except Exception:
             return None
@@ -93,13 +107,23 @@ class GitHubMilestoneRepository(BaseGitHubRepository):
         else:
             state = 'all'
         
-        milestones = self.repo.get_milestones(state=state)
+        # Let GitHub do the ordering when the requested order is one it supports
+        kwargs = {}
+        if options:
+            sort = _MILESTONE_SORTS.get(str(options.get('sort') or '').lower())
+            if sort:
+                kwargs['sort'] = sort
+            direction = str(options.get('direction') or '').lower()
+            if direction in _MILESTONE_DIRECTIONS:
+                kwargs['direction'] = direction
+        
+        milestones = self.repo.get_milestones(state=state, **kwargs)
         return [self._convert_milestone(milestone) for milestone in milestones]
     
     async def get_issues(self, id: MilestoneId) -> List:
         """Get issues for milestone."""
         from .github_issue_repository import GitHubIssueRepository
-        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config)
+        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
         return await issue_repo.find_by_milestone(id)
     
     def _convert_milestone(self, milestone) -> Milestone:
@@ -116,6 +140,12 @@ class GitHubMilestoneRepository(BaseGitHubRepository):
             created_at=milestone.created_at.isoformat() if milestone.created_at else "",
             updated_at=milestone.updated_at.isoformat() if milestone.updated_at else "",
             url=milestone.url,
-            progress=None  # Will need to calculate from issues
+            # GitHub keeps these counters on the milestone itself; they cover
+            # open and closed issues and pull requests, the same set
+            # GitHubIssueRepository.find_by_milestone returns
+            progress={
+                'open_issues': milestone.open_issues,
+                'closed_issues': milestone.closed_issues
+            }
         )
 
@@ -8,6 +8,12 @@ from .base_repository import BaseGitHubRepository
 from ....domain.types import Project, CreateProject, ProjectId, ProjectView, CustomField, IssueId, FieldOption
 from ....domain.resource_types import ResourceType, ResourceStatus
 
+# projectsV2 search filters for the statuses a project can have
+_STATUS_QUERIES = {
+    ResourceStatus.ACTIVE: "is:open",
+    ResourceStatus.CLOSED: "is:closed",
+}
+
 
 class GitHubProjectRepository(BaseGitHubRepository):
     """GitHub project repository."""
@@ -177,13 +183,31 @@ class GitHubProjectRepository(BaseGitHubRepository):
         
         return self._convert_to_project(node, None)
     
-    async def find_by_owner(self, owner: str) -> List[Project]:
-        """Find projects by owner."""
+    async def find_by_owner(
+        self,
+        owner: str,
+        limit: Optional[int] = None,
+        status: Optional[ResourceStatus] = None
+    ) -> List[Project]:
+        """Find projects by owner.
+        
+        With a limit, at most that many projects are requested, and the
+        organization query is skipped once the user's projects fill it.
+        A status is passed to GitHub as an ``is:open``/``is:closed`` filter.
+        """
+        if status:
+            status_query = _STATUS_QUERIES.get(ResourceStatus(status))
+            if status_query is None:
+                # Projects are only ever open or closed
+                return []
+        else:
+            status_query = None
+        
         # Query user and organization separately to handle cases where one doesn't exist
         user_query = """
-        query($owner: String!) {
+        query($owner: String!, $first: Int!, $query: String) {
           user(login: $owner) {
-            projectsV2(first: 100) {
+            projectsV2(first: $first, query: $query) {
               nodes {
                 id
                 title
@@ -198,9 +222,9 @@ class GitHubProjectRepository(BaseGitHubRepository):
         """
         
         org_query = """
-        query($owner: String!) {
+        query($owner: String!, $first: Int!, $query: String) {
           organization(login: $owner) {
-            projectsV2(first: 100) {
+            projectsV2(first: $first, query: $query) {
               nodes {
                 id
                 title
@@ -216,10 +240,15 @@ class GitHubProjectRepository(BaseGitHubRepository):
         
         user_projects = []
         org_projects = []
+        variables = {
+            "owner": owner,
+            "first": min(limit, 100) if limit else 100,
+            "query": status_query
+        }
         
         # Try to get user projects
         try:
-            user_response = await self.graphql(user_query, {"owner": owner})
+            user_response = await self.graphql(user_query, variables)
             user_projects = user_response.get("user", {}).get("projectsV2", {}).get("nodes", []) or []
         except Exception as e:
             error_msg = str(e)
@@ -229,9 +258,14 @@ class GitHubProjectRepository(BaseGitHubRepository):
                 # For other errors, we'll try org query and then decide
                 self._logger.warn(f"Error querying user projects: {error_msg}")
         
+        # User projects come first, so the org query can't add anything once
+        # they fill the limit
+        if limit and len(user_projects) >= limit:
+            return [self._convert_to_project(p, None) for p in user_projects[:limit]]
+        
         # Try to get organization projects
         try:
-            org_response = await self.graphql(org_query, {"owner": owner})
+            org_response = await self.graphql(org_query, variables)
             if org_response and isinstance(org_response, dict):
                 org_data = org_response.get("organization")
                 if org_data and isinstance(org_data, dict):
@@ -253,11 +287,17 @@ class GitHubProjectRepository(BaseGitHubRepository):
             org_projects = []
         
         all_projects = user_projects + org_projects
+        if limit:
+            all_projects = all_projects[:limit]
         return [self._convert_to_project(p, None) for p in all_projects]
     
-    async def find_all(self) -> List[Project]:
-        """Find all projects."""
-        return await self.find_by_owner(self._config.owner)
+    async def find_all(
+        self,
+        limit: Optional[int] = None,
+        status: Optional[ResourceStatus] = None
+    ) -> List[Project]:
+        """Find all projects, optionally filtered by status and capped at limit."""
+        return await self.find_by_owner(self._config.owner, limit, status)
     
     async def create_field(self, project_id: ProjectId, field: dict) -> CustomField:
         """Create field."""
@@ -581,6 +621,80 @@ class GitHubProjectRepository(BaseGitHubRepository):
             self._logger.error(f"Error getting project item ID for issue {issue_id}: {str(e)}")
             return None
     
+    async def find_project_item_with_field(
+        self,
+        issue_id: IssueId,
+        field_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Find the first project item for an issue whose project has a field.
+        
+        Resolves the issue's project items and each project's fields in one
+        query instead of listing projects and scanning their items.
+        
+        Returns:
+            Dict with "project_id", "item_id" and "field", or None if no
+            project containing the issue has a field with that name
+        """
+        query = """
+        query($owner: String!, $repo: String!, $number: Int!) {
+          repository(owner: $owner, name: $repo) {
+            issue(number: $number) {
+              projectItems(first: 20) {
+                nodes {
+                  id
+                  project {
+                    id
+                    fields(first: 50) {
+                      nodes {
+                        ... on ProjectV2Field {
+                          id
+                          name
+                          dataType
+                        }
+                        ... on ProjectV2SingleSelectField {
+                          id
+                          name
+                          dataType
+                          options {
+                            id
+                            name
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+        """
+        
+        try:
+            response = await self.graphql(query, {
+                "owner": self._config.owner,
+                "repo": self._config.repo,
+                "number": int(issue_id)
+            })
+            issue = (response.get("repository") or {}).get("issue") or {}
+            items = (issue.get("projectItems") or {}).get("nodes") or []
+            
+            wanted = field_name.lower()
+            for item in items:
+                project = item.get("project") or {}
+                for field in (project.get("fields") or {}).get("nodes") or []:
+                    if field.get("name", "").lower() == wanted:
+                        return {
+                            "project_id": project.get("id"),
+                            "item_id": item.get("id"),
+                            "field": field,
+                        }
+            
+            return None
+        except Exception as e:
+            self._logger.error(f"Error finding project item for issue {issue_id}: {str(e)}")
+            return None
+    
     async def list_fields(self, project_id: ProjectId) -> List[CustomField]:
         """List all fields for a project."""
         query = """
@@ -614,7 +728,10 @@ class GitHubProjectRepository(BaseGitHubRepository):
         
         try:
             response = await self.graphql(query, {"projectId": project_id})
-            fields_data = response.get("node", {}).get("fields", {}).get("nodes", [])
+            node = response.get("node")
+            if not node:
+                raise ValueError(f"Project {project_id} not found")
+            fields_data = node.get("fields", {}).get("nodes", [])
             
             fields = []
             for field_data in fields_data:
@@ -658,6 +775,46 @@ class GitHubProjectRepository(BaseGitHubRepository):
             self._logger.error(f"Error listing fields: {str(e)}")
             raise
     
+    async def list_views(self, project_id: ProjectId) -> List[ProjectView]:
+        """List all views for a project."""
+        from ..graphql_types import map_from_graphql_view_layout
+        from ....domain.types import ProjectView as DomainProjectView
+        
+        query = """
+        query($projectId: ID!) {
+          node(id: $projectId) {
+            ... on ProjectV2 {
+              views(first: 100) {
+                nodes {
+                  id
+                  name
+                  layout
+                }
+              }
+            }
+          }
+        }
+        """
+        
+        response = await self.graphql(query, {"projectId": project_id})
+        node = response.get("node")
+        if not node:
+            raise ValueError(f"Project {project_id} not found")
+        
+        return [
+            DomainProjectView(
+                id=view_data["id"],
+                name=view_data.get("name", ""),
+                layout=map_from_graphql_view_layout(view_data.get("layout")),
+                fields=None,
+                sort_by=None,
+                group_by=None,
+                filters=None,
+                settings=None
+            )
+            for view_data in node.get("views", {}).get("nodes", [])
+        ]
+    
     async def get_field_by_name(self, project_id: ProjectId, field_name: str) -> Optional[Dict[str, Any]]:
         """Get field by name from a project."""
         query = """
@@ -705,11 +862,17 @@ class GitHubProjectRepository(BaseGitHubRepository):
         project_id: ProjectId, 
         item_id: str, 
         field_id: str, 
-        value: Any
+        value: Any,
+        field: Optional[Dict[str, Any]] = None
     ) -> bool:
-        """Set field value for a project item."""
+        """Set field value for a project item.
+        
+        Pass the field (as returned by get_field_by_name) when the caller
+        already has it, to skip looking it up again.
+        """
         # Determine field type and format value accordingly
-        field = await self.get_field_by_id(project_id, field_id)
+        if field is None:
+            field = await self.get_field_by_id(project_id, field_id)
         if not field:
             raise ValueError(f"Field {field_id} not found in project")
         
@@ -133,7 +133,7 @@ class GitHubSprintRepository(BaseGitHubRepository):
         if not project_id:
             # Try to get the first active project
             from .github_project_repository import GitHubProjectRepository
-            project_repo = GitHubProjectRepository(self.github, self.repo, self._config)
+            project_repo = GitHubProjectRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
             projects = await project_repo.find_all()
             if projects:
                 project_id = projects[0].id
@@ -339,8 +339,8 @@ class GitHubSprintRepository(BaseGitHubRepository):
         from .github_issue_repository import GitHubIssueRepository
         from .github_project_repository import GitHubProjectRepository
         
-        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config)
-        project_repo = GitHubProjectRepository(self.github, self.repo, self._config)
+        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
+        project_repo = GitHubProjectRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
         
         # Get project items for issues
         for issue_id in issue_ids:
@@ -537,7 +537,7 @@ class GitHubSprintRepository(BaseGitHubRepository):
         project_id = self._config.project_id
         if not project_id:
             from .github_project_repository import GitHubProjectRepository
-            project_repo = GitHubProjectRepository(self.github, self.repo, self._config)
+            project_repo = GitHubProjectRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
             projects = await project_repo.find_all()
             if projects:
                 project_id = projects[0].id
@@ -624,7 +624,7 @@ class GitHubSprintRepository(BaseGitHubRepository):
         project_id = self._config.project_id
         if not project_id:
             from .github_project_repository import GitHubProjectRepository
-            project_repo = GitHubProjectRepository(self.github, self.repo, self._config)
+            project_repo = GitHubProjectRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
             projects = await project_repo.find_all()
             if projects:
                 project_id = projects[0].id
@@ -667,7 +667,7 @@ class GitHubSprintRepository(BaseGitHubRepository):
         project_id = self._config.project_id
         if not project_id:
             from .github_project_repository import GitHubProjectRepository
-            project_repo = GitHubProjectRepository(self.github, self.repo, self._config)
+            project_repo = GitHubProjectRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
             projects = await project_repo.find_all()
             if projects:
                 project_id = projects[0].id
@@ -713,7 +713,7 @@ class GitHubSprintRepository(BaseGitHubRepository):
         # Filter items that belong to this sprint
         sprint_issues = []
         from .github_issue_repository import GitHubIssueRepository
-        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config)
+        issue_repo = GitHubIssueRepository(self.github, self.repo, self._config, self._graphql_client.http_client)
         
         for item in items:
             field_values = item.get("fieldValues", {}).get("nodes", [])
@@ -32,7 +32,15 @@ class MCPResponseFormatter:
         else:
             content = str(data)
         
-        # Create response
+        return MCPResponseFormatter.format_serialized(content, content_type, metadata)
+    
+    @staticmethod
+    def format_serialized(
+        content: str,
+        content_type: MCPContentType = MCPContentType.JSON,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> MCPSuccessResponse:
+        """Format already-serialized content as MCP response."""
         return MCPSuccessResponse(
             version="1.0",
             request_id=metadata.get("requestId", "") if metadata else "",
@@ -68,8 +68,8 @@ class ListIssuesArgs(BaseModel):
 class ListMilestonesArgs(BaseModel):
     """List milestones arguments."""
     status: str = Field("open", description="Milestone status")
-    sort: str | None = Field(None, description="Sort field")
-    direction: str | None = Field(None, description="Sort direction")
+    sort: str | None = Field(None, description="Sort field: 'due_on' or 'completeness'")
+    direction: str | None = Field(None, description="Sort direction: 'asc' or 'desc'")
 
 
 class GetMilestoneMetricsArgs(BaseModel):
@@ -9,12 +9,14 @@ class ToolRegistry:
     
     _instance: Optional["ToolRegistry"] = None
     _tools: Dict[str, ToolDefinition]
+    _json_schemas: Dict[type, Dict[str, Any]]
     
     def __new__(cls):
         """Create singleton instance."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools = {}
+            cls._instance._json_schemas = {}
             cls._instance._register_built_in_tools()
         return cls._instance
     
@@ -218,7 +220,18 @@ class ToolRegistry:
         self.register_tool(list_labels_tool)
     
     def _convert_pydantic_to_json_schema(self, schema: type) -> Dict[str, Any]:
-        """Convert Pydantic model to JSON schema."""
+        """Convert Pydantic model to JSON schema, once per model class.
+        
+        Schema generation is the expensive part of list_tools and the tool
+        schemas never change at runtime, so the result is reused.
+        """
+        json_schema = self._json_schemas.get(schema)
+        if json_schema is None:
+            json_schema = self._json_schemas[schema] = self._build_json_schema(schema)
+        return json_schema
+    
+    def _build_json_schema(self, schema: type) -> Dict[str, Any]:
+        """Build the JSON schema for a Pydantic model."""
         try:
             from pydantic import BaseModel
             if issubclass(schema, BaseModel):
@@ -1,24 +1,172 @@
 """Tool result formatter."""
 
+import io
 import json
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
 from ..mcp.mcp_response_formatter import MCPResponseFormatter
 from ...domain.mcp_types import MCPContentType, MCPResponse
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
+
+# Sink the markdown/html writers emit fragments into
+Writer = Callable[[str], None]
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value to compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _now_str() -> str:
+    """Current local time as a metadata timestamp (second resolution)."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+
+
+def _format_key(key: str) -> str:
+    """Format a result key as a section title."""
+    return key.replace("_", " ").title()
+
+
+def _write_bullets(write: Writer, items: list) -> None:
+    """Write items as a Markdown bullet list, one JSON value per line."""
+    separator = "- "
+    for item in items:
+        write(separator)
+        write(_dumps(item))
+        separator = "\n- "
+
+
+def _md_list(write: Writer, result: list) -> None:
+    """Write a list result as Markdown."""
+    if result and isinstance(result[0], dict):
+        # Format array results as a table if possible
+        write(MCPResponseFormatter.format_as_markdown_table(result))
+    else:
+        # Simple list for arrays of primitives
+        _write_bullets(write, result)
+
+
+def _md_dict(write: Writer, result: dict) -> None:
+    """Write a dict result as Markdown, one section per key."""
+    separator = "## "
+    for key, value in result.items():
+        write(separator)
+        write(_format_key(key))
+        separator = "\n\n## "
+        if isinstance(value, list):
+            write("\n")
+            _write_bullets(write, value)
+        elif isinstance(value, dict):
+            write("\n\n```json\n")
+            write(_dumps(value))
+            write("\n```")
+        else:
+            write("\n")
+            write(str(value))
+
+
+def _md_scalar(write: Writer, result: Any) -> None:
+    """Write a simple value as Markdown."""
+    write(str(result))
+
+
+def _md_other(write: Writer, result: Any) -> None:
+    """Write a result whose exact type is not in the dispatch table."""
+    if isinstance(result, list):
+        _md_list(write, result)
+    elif isinstance(result, dict):
+        _md_dict(write, result)
+    else:
+        _md_scalar(write, result)
+
+
+def _html_list(write: Writer, result: list) -> None:
+    """Write a list result as HTML."""
+    write("<ul>")
+    for item in result:
+        write("<li>")
+        write(_dumps(item))
+        write("</li>")
+    write("</ul>")
+
+
+def _html_dict(write: Writer, result: dict) -> None:
+    """Write a dict result as HTML, one heading per key."""
+    for key, value in result.items():
+        write("<h3>")
+        write(_format_key(key))
+        write("</h3>")
+        if isinstance(value, (dict, list)):
+            write("<pre>")
+            write(_dumps(value))
+            write("</pre>")
+        else:
+            write("<p>")
+            write(str(value))
+            write("</p>")
+
+
+def _html_scalar(write: Writer, result: Any) -> None:
+    """Write a simple value as HTML."""
+    write("<p>")
+    write(str(result))
+    write("</p>")
+
+
+def _html_other(write: Writer, result: Any) -> None:
+    """Write a result whose exact type is not in the dispatch table."""
+    if isinstance(result, dict):
+        _html_dict(write, result)
+    elif isinstance(result, list):
+        _html_list(write, result)
+    else:
+        _html_scalar(write, result)
+
+
+# Exact-type lookup tables; subclasses fall through to the *_other handlers
+_MD_DISPATCH: Dict[type, Callable[[Writer, Any], None]] = {
+    dict: _md_dict,
+    list: _md_list,
+    str: _md_scalar,
+    int: _md_scalar,
+    float: _md_scalar,
+    bool: _md_scalar,
+}
+
+_HTML_DISPATCH: Dict[type, Callable[[Writer, Any], None]] = {
+    dict: _html_dict,
+    list: _html_list,
+    str: _html_scalar,
+    int: _html_scalar,
+    float: _html_scalar,
+    bool: _html_scalar,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class FormattingOptions:
     """Formatting options."""
     
-    def __init__(
-        self,
-        content_type: Optional[MCPContentType] = None,
-        request_id: Optional[str] = None,
-        include_raw_data: bool = False
-    ):
-        self.content_type = content_type or MCPContentType.JSON
-        self.request_id = request_id
-        self.include_raw_data = include_raw_data
+    content_type: Optional[MCPContentType] = None
+    request_id: Optional[str] = None
+    include_raw_data: bool = False
+    
+    def __post_init__(self):
+        """Default the content type to JSON."""
+        if self.content_type is None:
+            object.__setattr__(self, "content_type", MCPContentType.JSON)
+
+
+# Shared instance for callers that don't pass options; safe because it is frozen
+_DEFAULT_OPTIONS = FormattingOptions()
 
 
 class ToolResultFormatter:
@@ -32,81 +180,60 @@ class ToolResultFormatter:
     ) -> MCPResponse:
         """Format a tool result as a successful MCP response."""
         if options is None:
-            options = FormattingOptions()
+            options = _DEFAULT_OPTIONS
         
         content_type = options.content_type or MCPContentType.JSON
+        metadata = {
+            "tool": tool_name,
+            "timestamp": _now_str(),
+            "requestId": options.request_id,
+        }
         
         # Determine the right content format based on the result type and requested content type
         if content_type == MCPContentType.MARKDOWN:
-            return ToolResultFormatter._format_as_markdown(tool_name, result, options)
+            return ToolResultFormatter._format_as_markdown(tool_name, result, options, metadata)
         elif content_type == MCPContentType.HTML:
-            return ToolResultFormatter._format_as_html(tool_name, result, options)
+            return ToolResultFormatter._format_as_html(tool_name, result, options, metadata)
         elif content_type == MCPContentType.TEXT:
-            return ToolResultFormatter._format_as_text(tool_name, result, options)
+            return ToolResultFormatter._format_as_text(tool_name, result, options, metadata)
         else:
-            return ToolResultFormatter._format_as_json(tool_name, result, options)
+            return ToolResultFormatter._format_as_json(tool_name, result, options, metadata)
     
     @staticmethod
     def _format_as_json(
         tool_name: str,
         result: Any,
-        options: FormattingOptions
+        options: FormattingOptions,
+        metadata: Dict[str, Any]
     ) -> MCPResponse:
         """Format result as JSON."""
-        metadata = {
-            "tool": tool_name,
-            "timestamp": str(datetime.now()),
-            "requestId": options.request_id,
-        }
-        
-        return MCPResponseFormatter.format(result, MCPContentType.JSON, metadata)
+        # Serialize straight to the response content, no second encoding pass
+        return MCPResponseFormatter.format_serialized(_dumps(result), MCPContentType.JSON, metadata)
     
     @staticmethod
     def _format_as_markdown(
         tool_name: str,
         result: Any,
-        options: FormattingOptions
+        options: FormattingOptions,
+        metadata: Dict[str, Any]
     ) -> MCPResponse:
         """Format result as Markdown."""
-        # Add a title based on the tool name
-        markdown = f"# {ToolResultFormatter._format_tool_name(tool_name)} Result\n\n"
+        buffer = io.StringIO()
+        write = buffer.write
         
-        # Handle different types of results
-        if isinstance(result, list):
-            # Format array results as a table if possible
-            if result and isinstance(result[0], dict):
-                markdown += MCPResponseFormatter.format_as_markdown_table(result)
-            else:
-                # Simple list for arrays of primitives
-                markdown += "\n".join(f"- {json.dumps(item)}" for item in result)
-        elif isinstance(result, dict):
-            # Format key properties as headers with details
-            sections = []
-            for key, value in result.items():
-                formatted_key = key.replace("_", " ").title()
-                
-                if isinstance(value, list):
-                    # Format arrays as lists
-                    sections.append(f"## {formatted_key}\n" + "\n".join(f"- {json.dumps(item)}" for item in value))
-                elif isinstance(value, dict):
-                    # Format objects with nested details
-                    sections.append(f"## {formatted_key}\n\n```json\n{json.dumps(value, indent=2)}\n```")
-                else:
-                    sections.append(f"## {formatted_key}\n{value}")
-            markdown += "\n\n".join(sections)
-        else:
-            # Simple value
-            markdown += str(result)
+        # Add a title based on the tool name
+        write("# ")
+        write(ToolResultFormatter._format_tool_name(tool_name))
+        write(" Result\n\n")
+        _MD_DISPATCH.get(type(result), _md_other)(write, result)
         
         # Include raw JSON data if requested
         if options.include_raw_data:
-            markdown += f'\n\n## Raw Data\n\n```json\n{json.dumps(result)}\n```'
+            write("\n\n## Raw Data\n\n```json\n")
+            write(_dumps(result))
+            write("\n```")
         
-        metadata = {
-            "tool": tool_name,
-            "timestamp": str(datetime.now()),
-            "requestId": options.request_id,
-        }
+        markdown = buffer.getvalue()
         
         return MCPResponseFormatter.format(markdown, MCPContentType.MARKDOWN, metadata)
     
@@ -114,32 +241,19 @@ class ToolResultFormatter:
     def _format_as_html(
         tool_name: str,
         result: Any,
-        options: FormattingOptions
+        options: FormattingOptions,
+        metadata: Dict[str, Any]
     ) -> MCPResponse:
         """Format result as HTML."""
-        html = f"<h1>{ToolResultFormatter._format_tool_name(tool_name)} Result</h1>\n"
+        buffer = io.StringIO()
+        write = buffer.write
         
-        if isinstance(result, dict):
-            for key, value in result.items():
-                formatted_key = key.replace("_", " ").title()
-                html += f"<h3>{formatted_key}</h3>"
-                if isinstance(value, (dict, list)):
-                    html += f"<pre>{json.dumps(value, indent=2)}</pre>"
-                else:
-                    html += f"<p>{value}</p>"
-        elif isinstance(result, list):
-            html += "<ul>"
-            for item in result:
-                html += f"<li>{json.dumps(item)}</li>"
-            html += "</ul>"
-        else:
-            html += f"<p>{result}</p>"
+        write("<h1>")
+        write(ToolResultFormatter._format_tool_name(tool_name))
+        write(" Result</h1>\n")
+        _HTML_DISPATCH.get(type(result), _html_other)(write, result)
         
-        metadata = {
-            "tool": tool_name,
-            "timestamp": str(datetime.now()),
-            "requestId": options.request_id,
-        }
+        html = buffer.getvalue()
         
         return MCPResponseFormatter.format(html, MCPContentType.HTML, metadata)
     
@@ -147,18 +261,13 @@ class ToolResultFormatter:
     def _format_as_text(
         tool_name: str,
         result: Any,
-        options: FormattingOptions
+        options: FormattingOptions,
+        metadata: Dict[str, Any]
     ) -> MCPResponse:
         """Format result as plain text."""
         text = f"{ToolResultFormatter._format_tool_name(tool_name)} Result\n\n"
         text += str(result)
         
-        metadata = {
-            "tool": tool_name,
-            "timestamp": str(datetime.now()),
-            "requestId": options.request_id,
-        }
-        
         return MCPResponseFormatter.format(text, MCPContentType.TEXT, metadata)
     
     @staticmethod
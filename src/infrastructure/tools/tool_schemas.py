@@ -1,7 +1,7 @@
 """Tool schemas and definitions for MCP tools."""
 
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from .tool_validator import ToolDefinition
 
 
@@ -9,21 +9,30 @@ from .tool_validator import ToolDefinition
 # Pydantic Schemas for Tool Arguments
 # ============================================================================
 
-class CreateRoadmapProject(BaseModel):
+class _ToolArgsModel(BaseModel):
+    """Base for tool argument schemas.
+    
+    Validators are built on first use rather than at import, so loading this
+    module doesn't pay for every tool's core schema up front.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class CreateRoadmapProject(_ToolArgsModel):
     """Create roadmap project."""
     title: str = Field(..., min_length=1, description="Project title")
     short_description: Optional[str] = Field(None, description="Project short description")
     visibility: str = Field(..., description="Project visibility")
 
 
-class CreateRoadmapMilestone(BaseModel):
+class CreateRoadmapMilestone(_ToolArgsModel):
     """Create roadmap milestone."""
     title: str = Field(..., min_length=1, description="Milestone title")
     description: str = Field(..., min_length=1, description="Milestone description")
     due_date: Optional[str] = Field(None, description="Due date (ISO format)")
 
 
-class CreateRoadmapIssue(BaseModel):
+class CreateRoadmapIssue(_ToolArgsModel):
     """Create roadmap issue."""
     title: str = Field(..., min_length=1, description="Issue title")
     description: str = Field(..., min_length=1, description="Issue description")
@@ -33,19 +42,19 @@ class CreateRoadmapIssue(BaseModel):
     labels: List[str] = Field(default_factory=list, description="Labels")
 
 
-class CreateRoadmapMilestoneData(BaseModel):
+class CreateRoadmapMilestoneData(_ToolArgsModel):
     """Create roadmap milestone data."""
     milestone: CreateRoadmapMilestone
     issues: List[CreateRoadmapIssue] = Field(default_factory=list, description="Issues")
 
 
-class CreateRoadmapArgs(BaseModel):
+class CreateRoadmapArgs(_ToolArgsModel):
     """Create roadmap arguments."""
     project: CreateRoadmapProject
     milestones: List[CreateRoadmapMilestoneData]
 
 
-class PlanSprintSprint(BaseModel):
+class PlanSprintSprint(_ToolArgsModel):
     """Plan sprint sprint."""
     title: str = Field(..., min_length=1, description="Sprint title")
     start_date: str = Field(..., description="Start date (ISO format)")
@@ -53,38 +62,38 @@ class PlanSprintSprint(BaseModel):
     goals: List[str] = Field(default_factory=list, description="Sprint goals")
 
 
-class PlanSprintArgs(BaseModel):
+class PlanSprintArgs(_ToolArgsModel):
     """Plan sprint arguments."""
     sprint: PlanSprintSprint
     issue_ids: List[str] = Field(default_factory=list, description="Issue IDs")
 
 
-class GetMilestoneMetricsArgs(BaseModel):
+class GetMilestoneMetricsArgs(_ToolArgsModel):
     """Get milestone metrics arguments."""
     milestone_id: str = Field(..., min_length=1, description="Milestone ID")
     include_issues: bool = Field(False, description="Include issues")
 
 
-class GetSprintMetricsArgs(BaseModel):
+class GetSprintMetricsArgs(_ToolArgsModel):
     """Get sprint metrics arguments."""
     sprint_id: str = Field(..., min_length=1, description="Sprint ID")
     include_issues: bool = Field(False, description="Include issues")
 
 
-class GetOverdueMilestonesArgs(BaseModel):
+class GetOverdueMilestonesArgs(_ToolArgsModel):
     """Get overdue milestones arguments."""
     limit: int = Field(..., gt=0, description="Limit")
     include_issues: bool = Field(False, description="Include issues")
 
 
-class GetUpcomingMilestonesArgs(BaseModel):
+class GetUpcomingMilestonesArgs(_ToolArgsModel):
     """Get upcoming milestones arguments."""
     days_ahead: int = Field(..., gt=0, description="Days ahead")
     limit: int = Field(..., gt=0, description="Limit")
     include_issues: bool = Field(False, description="Include issues")
 
 
-class CreateProjectArgs(BaseModel):
+class CreateProjectArgs(_ToolArgsModel):
     """Create project arguments."""
     title: str = Field(..., min_length=1, description="Project title")
     short_description: Optional[str] = Field(None, description="Project short description")
@@ -92,18 +101,18 @@ class CreateProjectArgs(BaseModel):
     visibility: str = Field("private", description="Project visibility")
 
 
-class ListProjectsArgs(BaseModel):
+class ListProjectsArgs(_ToolArgsModel):
     """List projects arguments."""
     status: str = Field("active", description="Project status")
     limit: Optional[int] = Field(None, gt=0, description="Limit")
 
 
-class GetProjectArgs(BaseModel):
+class GetProjectArgs(_ToolArgsModel):
     """Get project arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
 
 
-class UpdateProjectArgs(BaseModel):
+class UpdateProjectArgs(_ToolArgsModel):
     """Update project arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     title: Optional[str] = Field(None, description="Project title")
@@ -112,26 +121,26 @@ class UpdateProjectArgs(BaseModel):
     status: Optional[str] = Field(None, description="Project status")
 
 
-class DeleteProjectArgs(BaseModel):
+class DeleteProjectArgs(_ToolArgsModel):
     """Delete project arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
 
 
-class CreateMilestoneArgs(BaseModel):
+class CreateMilestoneArgs(_ToolArgsModel):
     """Create milestone arguments."""
     title: str = Field(..., min_length=1, description="Milestone title")
     description: str = Field(..., min_length=1, description="Milestone description")
     due_date: Optional[str] = Field(None, description="Due date (ISO format)")
 
 
-class ListMilestonesArgs(BaseModel):
+class ListMilestonesArgs(_ToolArgsModel):
     """List milestones arguments."""
     status: str = Field("open", description="Milestone status")
-    sort: Optional[str] = Field(None, description="Sort field")
-    direction: Optional[str] = Field(None, description="Sort direction")
+    sort: Optional[str] = Field(None, description="Sort field: 'due_on' or 'completeness'")
+    direction: Optional[str] = Field(None, description="Sort direction: 'asc' or 'desc'")
 
 
-class UpdateMilestoneArgs(BaseModel):
+class UpdateMilestoneArgs(_ToolArgsModel):
     """Update milestone arguments."""
     milestone_id: str = Field(..., min_length=1, description="Milestone ID")
     title: Optional[str] = Field(None, description="Milestone title")
@@ -140,12 +149,12 @@ class UpdateMilestoneArgs(BaseModel):
     state: Optional[str] = Field(None, description="Milestone state")
 
 
-class DeleteMilestoneArgs(BaseModel):
+class DeleteMilestoneArgs(_ToolArgsModel):
     """Delete milestone arguments."""
     milestone_id: str = Field(..., min_length=1, description="Milestone ID")
 
 
-class CreateIssueArgs(BaseModel):
+class CreateIssueArgs(_ToolArgsModel):
     """Create issue arguments."""
     title: str = Field(..., min_length=1, description="Issue title")
     description: str = Field(..., min_length=1, description="Issue description")
@@ -156,7 +165,7 @@ class CreateIssueArgs(BaseModel):
     type: Optional[str] = Field(None, description="Issue type")
 
 
-class ListIssuesArgs(BaseModel):
+class ListIssuesArgs(_ToolArgsModel):
     """List issues arguments."""
     status: str = Field("open", description="Issue status")
     milestone: Optional[str] = Field(None, description="Milestone")
@@ -167,12 +176,12 @@ class ListIssuesArgs(BaseModel):
     limit: Optional[int] = Field(None, gt=0, description="Limit")
 
 
-class GetIssueArgs(BaseModel):
+class GetIssueArgs(_ToolArgsModel):
     """Get issue arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
 
 
-class UpdateIssueArgs(BaseModel):
+class UpdateIssueArgs(_ToolArgsModel):
     """Update issue arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
     title: Optional[str] = Field(None, description="Issue title")
@@ -185,49 +194,49 @@ class UpdateIssueArgs(BaseModel):
     project_id: Optional[str] = Field(None, description="Project ID (required if setting project_field_values)")
 
 
-class AddIssueCommentArgs(BaseModel):
+class AddIssueCommentArgs(_ToolArgsModel):
     """Add issue comment arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
     body: str = Field(..., min_length=1, description="Comment body")
 
 
-class ListIssueCommentsArgs(BaseModel):
+class ListIssueCommentsArgs(_ToolArgsModel):
     """List issue comments arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
 
 
-class UpdateIssueCommentArgs(BaseModel):
+class UpdateIssueCommentArgs(_ToolArgsModel):
     """Update issue comment arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
     comment_id: str = Field(..., min_length=1, description="Comment ID")
     body: str = Field(..., min_length=1, description="Updated comment body")
 
 
-class DeleteIssueCommentArgs(BaseModel):
+class DeleteIssueCommentArgs(_ToolArgsModel):
     """Delete issue comment arguments."""
     issue_id: str = Field(..., min_length=1, description="Issue ID")
     comment_id: str = Field(..., min_length=1, description="Comment ID")
 
 
-class SearchIssuesArgs(BaseModel):
+class SearchIssuesArgs(_ToolArgsModel):
     """Search issues arguments."""
     query: str = Field(..., min_length=1, description="GitHub search query syntax. Examples: 'is:issue is:open label:bug', 'is:issue author:username', 'is:issue assignee:username'")
 
 
-class FilterProjectItemsArgs(BaseModel):
+class FilterProjectItemsArgs(_ToolArgsModel):
     """Filter project items arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     field_filters: Dict[str, Any] = Field(..., description="Dictionary mapping field names to values. Example: {'Priority': 'High', 'Status': 'In Progress'}")
 
 
-class FindIssuesByFieldArgs(BaseModel):
+class FindIssuesByFieldArgs(_ToolArgsModel):
     """Find issues by field arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     field_name: str = Field(..., min_length=1, description="Name of the field to filter by")
     field_value: Any = Field(..., description="Value to match")
 
 
-class CreateSprintArgs(BaseModel):
+class CreateSprintArgs(_ToolArgsModel):
     """Create sprint arguments."""
     title: str = Field(..., min_length=1, description="Sprint title")
     description: str = Field(..., min_length=1, description="Sprint description")
@@ -236,17 +245,17 @@ class CreateSprintArgs(BaseModel):
     issue_ids: List[str] = Field(default_factory=list, description="Issue IDs")
 
 
-class ListSprintsArgs(BaseModel):
+class ListSprintsArgs(_ToolArgsModel):
     """List sprints arguments."""
     status: str = Field("all", description="Sprint status")
 
 
-class GetCurrentSprintArgs(BaseModel):
+class GetCurrentSprintArgs(_ToolArgsModel):
     """Get current sprint arguments."""
     include_issues: bool = Field(True, description="Include issues")
 
 
-class UpdateSprintArgs(BaseModel):
+class UpdateSprintArgs(_ToolArgsModel):
     """Update sprint arguments."""
     sprint_id: str = Field(..., min_length=1, description="Sprint ID")
     title: Optional[str] = Field(None, description="Sprint title")
@@ -256,19 +265,19 @@ class UpdateSprintArgs(BaseModel):
     status: Optional[str] = Field(None, description="Sprint status")
 
 
-class AddIssuesToSprintArgs(BaseModel):
+class AddIssuesToSprintArgs(_ToolArgsModel):
     """Add issues to sprint arguments."""
     sprint_id: str = Field(..., min_length=1, description="Sprint ID")
     issue_ids: List[str] = Field(..., min_length=1, description="Issue IDs")
 
 
-class RemoveIssuesFromSprintArgs(BaseModel):
+class RemoveIssuesFromSprintArgs(_ToolArgsModel):
     """Remove issues from sprint arguments."""
     sprint_id: str = Field(..., min_length=1, description="Sprint ID")
     issue_ids: List[str] = Field(..., min_length=1, description="Issue IDs")
 
 
-class CreateProjectFieldArgs(BaseModel):
+class CreateProjectFieldArgs(_ToolArgsModel):
     """Create project field arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     name: str = Field(..., min_length=1, description="Field name")
@@ -283,19 +292,19 @@ class CreateProjectFieldArgs(BaseModel):
         arbitrary_types_allowed = True
 
 
-class CreateProjectViewArgs(BaseModel):
+class CreateProjectViewArgs(_ToolArgsModel):
     """Create project view arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     name: str = Field(..., min_length=1, description="View name")
     layout: str = Field(..., description="View layout")
 
 
-class ListProjectFieldsArgs(BaseModel):
+class ListProjectFieldsArgs(_ToolArgsModel):
     """List project fields arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
 
 
-class UpdateProjectFieldArgs(BaseModel):
+class UpdateProjectFieldArgs(_ToolArgsModel):
     """Update project field arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     field_id: str = Field(..., min_length=1, description="Field ID")
@@ -305,12 +314,12 @@ class UpdateProjectFieldArgs(BaseModel):
     required: Optional[bool] = Field(None, description="Required")
 
 
-class ListProjectViewsArgs(BaseModel):
+class ListProjectViewsArgs(_ToolArgsModel):
     """List project views arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
 
 
-class UpdateProjectViewArgs(BaseModel):
+class UpdateProjectViewArgs(_ToolArgsModel):
     """Update project view arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     view_id: str = Field(..., min_length=1, description="View ID")
@@ -318,13 +327,13 @@ class UpdateProjectViewArgs(BaseModel):
     layout: Optional[str] = Field(None, description="View layout")
 
 
-class DeleteProjectViewArgs(BaseModel):
+class DeleteProjectViewArgs(_ToolArgsModel):
     """Delete project view arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     view_id: str = Field(..., min_length=1, description="View ID")
 
 
-class AddProjectItemArgs(BaseModel):
+class AddProjectItemArgs(_ToolArgsModel):
     """Add project item arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     content_id: str = Field(..., min_length=1, description="Content ID")
@@ -333,19 +342,19 @@ class AddProjectItemArgs(BaseModel):
     type: Optional[str] = Field(None, description="Issue type (optional, will be set on project item if field exists)")
 
 
-class RemoveProjectItemArgs(BaseModel):
+class RemoveProjectItemArgs(_ToolArgsModel):
     """Remove project item arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     item_id: str = Field(..., min_length=1, description="Item ID")
 
 
-class ListProjectItemsArgs(BaseModel):
+class ListProjectItemsArgs(_ToolArgsModel):
     """List project items arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     limit: Optional[int] = Field(None, gt=0, description="Limit")
 
 
-class SetFieldValueArgs(BaseModel):
+class SetFieldValueArgs(_ToolArgsModel):
     """Set field value arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     item_id: str = Field(..., min_length=1, description="Item ID")
@@ -353,28 +362,28 @@ class SetFieldValueArgs(BaseModel):
     value: Any = Field(..., description="Field value")
 
 
-class GetFieldValueArgs(BaseModel):
+class GetFieldValueArgs(_ToolArgsModel):
     """Get field value arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     item_id: str = Field(..., min_length=1, description="Item ID")
     field_id: str = Field(..., min_length=1, description="Field ID")
 
 
-class ClearFieldValueArgs(BaseModel):
+class ClearFieldValueArgs(_ToolArgsModel):
     """Clear field value arguments."""
     project_id: str = Field(..., min_length=1, description="Project ID")
     item_id: str = Field(..., min_length=1, description="Item ID")
     field_id: str = Field(..., min_length=1, description="Field ID")
 
 
-class CreateLabelArgs(BaseModel):
+class CreateLabelArgs(_ToolArgsModel):
     """Create label arguments."""
     name: str = Field(..., min_length=1, description="Label name")
     color: str = Field(..., description="Label color (hex)")
     description: Optional[str] = Field(None, description="Label description")
 
 
-class ListLabelsArgs(BaseModel):
+class ListLabelsArgs(_ToolArgsModel):
     """List labels arguments."""
     limit: Optional[int] = Field(None, gt=0, description="Limit")
 
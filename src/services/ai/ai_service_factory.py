@@ -1,16 +1,14 @@
 """AI service factory for creating AI model instances."""
 
+import functools
 import os
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
-from ai import LanguageModel
-from anthropic import Anthropic
-from openai import OpenAI
-from google.generativeai import GenerativeModel
-import sys
+from ...infrastructure.logger import get_logger
 
 
-@dataclass
+@dataclass(slots=True)
 class AIModelConfig:
     """AI model configuration."""
     provider: str
@@ -18,7 +16,7 @@ class AIModelConfig:
     api_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AIServiceConfig:
     """AI service configuration."""
     main: Optional[AIModelConfig] = None
@@ -27,25 +25,124 @@ class AIServiceConfig:
     prd: Optional[AIModelConfig] = None
 
 
+# (model name prefixes, provider, API key env var), checked in order
+_PREFIX_RULES = (
+    (('claude-',), 'anthropic', 'ANTHROPIC_API_KEY'),
+    (('gpt-', 'o1'), 'openai', 'OPENAI_API_KEY'),
+    (('gemini-',), 'google', 'GOOGLE_API_KEY'),
+)
+
+# (model name substrings, provider, API key env var), checked after prefixes
+_SUBSTRING_RULES = (
+    (('perplexity', 'llama', 'sonar'), 'perplexity', 'PERPLEXITY_API_KEY'),
+)
+
+# Provider API key env vars, in the order validate_configuration reports them
+_API_KEY_VARS = (
+    ('anthropic', 'ANTHROPIC_API_KEY'),
+    ('openai', 'OPENAI_API_KEY'),
+    ('google', 'GOOGLE_API_KEY'),
+    ('perplexity', 'PERPLEXITY_API_KEY'),
+)
+
+# Model types tried by get_best_available_model, best first
+_FALLBACK_ORDER = ('main', 'fallback', 'prd', 'research')
+
+# Used for model names no rule recognizes
+_DEFAULT_MODEL = ('anthropic', 'claude-3-5-sonnet-20241022', 'ANTHROPIC_API_KEY')
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_model(model_string: str) -> tuple[str, str, str]:
+    """Map a model string to (provider, model, API key env var)."""
+    for prefixes, provider, env_var in _PREFIX_RULES:
+        if model_string.startswith(prefixes):
+            return provider, model_string, env_var
+    for needles, provider, env_var in _SUBSTRING_RULES:
+        if any(needle in model_string for needle in needles):
+            return provider, model_string, env_var
+    return _DEFAULT_MODEL
+
+
+# Provider client constructors. Each imports its SDK on first use, since the
+# SDKs are heavy and most setups only configure one or two providers.
+def _create_anthropic_client(config: AIModelConfig) -> Any:
+    from anthropic import Anthropic
+    return Anthropic(api_key=config.api_key)
+
+
+def _create_openai_client(config: AIModelConfig) -> Any:
+    from openai import OpenAI
+    return OpenAI(api_key=config.api_key)
+
+
+def _create_google_client(config: AIModelConfig) -> Any:
+    from google.generativeai import GenerativeModel
+    return GenerativeModel(model_name=config.model)
+
+
+_CLIENT_FACTORIES: Dict[str, Callable[[AIModelConfig], Any]] = {
+    'anthropic': _create_anthropic_client,
+    'openai': _create_openai_client,
+    'google': _create_google_client,
+}
+
+
 class AIServiceFactory:
     """Factory for creating AI service instances."""
     
     _instance: Optional['AIServiceFactory'] = None
+    _instance_lock = threading.Lock()
     _config: AIServiceConfig
     
     def __init__(self):
         """Initialize AI service factory."""
         if AIServiceFactory._instance is not None:
             raise RuntimeError("AIServiceFactory is a singleton. Use get_instance() instead.")
+        self._logger = get_logger(self.__class__.__name__)
+        # Each missing provider/model warning is reported once per process
+        self._warned: set[str] = set()
+        self._env = self._snapshot_env()
         self._config = self._build_configuration()
+        self._fallback_order = self._available_model_types()
+        # Provider clients are built once per model type and reused, so their
+        # HTTP connection pools survive between calls
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
     
     @classmethod
     def get_instance(cls) -> 'AIServiceFactory':
         """Get singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls.__new__(cls)
-            cls._instance.__init__()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    # Publish only after __init__ so its singleton guard passes
+                    # and other threads never see a half-built factory
+                    instance = cls.__new__(cls)
+                    instance.__init__()
+                    cls._instance = instance
+        return instance
+    
+    def _warn_once(self, key: str, message: str) -> None:
+        """Log a warning the first time it is seen for key."""
+        if key not in self._warned:
+            self._warned.add(key)
+            self._logger.warn(message)
+    
+    @staticmethod
+    def _snapshot_env() -> Dict[str, str]:
+        """Read the provider API keys once; they don't change while running."""
+        return {env_var: os.getenv(env_var, '') for _, env_var in _API_KEY_VARS}
+    
+    def refresh_env(self) -> None:
+        """Re-read provider API keys and rebuild the configuration."""
+        with self._clients_lock:
+            self._env = self._snapshot_env()
+            self._config = self._build_configuration()
+            self._fallback_order = self._available_model_types()
+            self._clients = {}
     
     def _build_configuration(self) -> AIServiceConfig:
         """Build AI service configuration from environment variables."""
@@ -63,40 +160,24 @@ class AIServiceFactory:
             prd=self._parse_model_config(AI_PRD_MODEL)
         )
     
+    def _available_model_types(self) -> tuple[str, ...]:
+        """Configured model types in fallback order."""
+        return tuple(t for t in _FALLBACK_ORDER if getattr(self._config, t))
+    
     def _parse_model_config(self, model_string: str) -> Optional[AIModelConfig]:
         """Parse model configuration from model string."""
         if not model_string:
             return None
         
-        # Extract provider from model name
-        provider: str
-        model: str
-        api_key: str
-        
-        if model_string.startswith('claude-'):
-            provider = 'anthropic'
-            model = model_string
-            api_key = os.getenv('ANTHROPIC_API_KEY', '')
-        elif model_string.startswith('gpt-') or model_string.startswith('o1'):
-            provider = 'openai'
-            model = model_string
-            api_key = os.getenv('OPENAI_API_KEY', '')
-        elif model_string.startswith('gemini-'):
-            provider = 'google'
-            model = model_string
-            api_key = os.getenv('GOOGLE_API_KEY', '')
-        elif 'perplexity' in model_string or 'llama' in model_string or 'sonar' in model_string:
-            provider = 'perplexity'
-            model = model_string
-            api_key = os.getenv('PERPLEXITY_API_KEY', '')
-        else:
-            # Default to anthropic for unknown models
-            provider = 'anthropic'
-            model = 'claude-3-5-sonnet-20241022'
-            api_key = os.getenv('ANTHROPIC_API_KEY', '')
+        # Extract provider from model name; unknown models default to anthropic
+        provider, model, env_var = _resolve_model(model_string)
+        api_key = self._env[env_var]
         
         if not api_key:
-            sys.stderr.write(f"⚠️  AI Provider Warning: No API key found for {provider} provider. AI features using this provider will be disabled.\n")
+            self._warn_once(
+                f"provider:{provider}",
+                f"⚠️  AI Provider Warning: No API key found for {provider} provider. AI features using this provider will be disabled."
+            )
             return None
         
         return AIModelConfig(provider=provider, model=model, api_key=api_key)
@@ -106,19 +187,27 @@ class AIServiceFactory:
         config = getattr(self._config, model_type, None)
         
         if not config:
-            sys.stderr.write(f"⚠️  AI Model Warning: {model_type} model is not available due to missing API key.\n")
+            self._warn_once(
+                f"model:{model_type}",
+                f"⚠️  AI Model Warning: {model_type} model is not available due to missing API key."
+            )
             return None
         
         # For Python, we'll return the appropriate client/model
         # This is a simplified version - actual implementation would use proper AI SDKs
-        if config.provider == 'anthropic':
-            return Anthropic(api_key=config.api_key)
-        elif config.provider == 'openai':
-            return OpenAI(api_key=config.api_key)
-        elif config.provider == 'google':
-            return GenerativeModel(model_name=config.model)
-        else:
+        client = self._clients.get(model_type)
+        if client is not None:
+            return client
+        
+        create_client = _CLIENT_FACTORIES.get(config.provider)
+        if create_client is None:
             raise ValueError(f"Unsupported AI provider: {config.provider}")
+        
+        with self._clients_lock:
+            client = self._clients.get(model_type)
+            if client is None:
+                client = self._clients[model_type] = create_client(config)
+        return client
     
     def get_main_model(self) -> Optional[Any]:
         """Get main AI model (for general task generation)."""
@@ -138,25 +227,12 @@ class AIServiceFactory:
     
     def get_best_available_model(self) -> Optional[Any]:
         """Get the best available model with fallback logic."""
-        # Try main model first
-        main_model = self.get_main_model()
-        if main_model:
-            return main_model
-        
-        # Try fallback model
-        fallback_model = self.get_fallback_model()
-        if fallback_model:
-            return fallback_model
-        
-        # Try PRD model
-        prd_model = self.get_prd_model()
-        if prd_model:
-            return prd_model
-        
-        # Try research model
-        research_model = self.get_research_model()
-        if research_model:
-            return research_model
+        # Only configured model types are tried, so unavailable ones don't
+        # emit warnings; clients are cached, so this is usually a dict lookup
+        for model_type in self._fallback_order:
+            model = self.get_model(model_type)
+            if model:
+                return model
         
         # No models available
         return None
@@ -177,25 +253,11 @@ class AIServiceFactory:
         unavailable_models: List[str] = []
         
         # Check each provider
-        if not os.getenv('ANTHROPIC_API_KEY'):
-            missing.append('ANTHROPIC_API_KEY')
-        else:
-            available.append('anthropic')
-        
-        if not os.getenv('OPENAI_API_KEY'):
-            missing.append('OPENAI_API_KEY')
-        else:
-            available.append('openai')
-        
-        if not os.getenv('GOOGLE_API_KEY'):
-            missing.append('GOOGLE_API_KEY')
-        else:
-            available.append('google')
-        
-        if not os.getenv('PERPLEXITY_API_KEY'):
-            missing.append('PERPLEXITY_API_KEY')
-        else:
-            available.append('perplexity')
+        for provider, env_var in _API_KEY_VARS:
+            if self._env[env_var]:
+                available.append(provider)
+            else:
+                missing.append(env_var)
         
         # Check which models are available
         if self._config.main:
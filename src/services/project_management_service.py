@@ -1,6 +1,18 @@
 """Project management service."""
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import hashlib
+import heapq
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import asdict, fields, is_dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple, TypedDict
 from ..infrastructure.github.github_repository_factory import GitHubRepositoryFactory
 from ..infrastructure.github.repositories.github_issue_repository import GitHubIssueRepository
 from ..infrastructure.github.repositories.github_milestone_repository import GitHubMilestoneRepository
@@ -28,73 +40,345 @@ from ..domain.types import (
     CommentId
 )
 from ..domain.resource_types import ResourceStatus
+from ..infrastructure.logger import get_logger
+
+# Cap on concurrent per-milestone metrics requests, to stay clear of GitHub's
+# secondary rate limits
+_METRICS_CONCURRENCY = 10
+
+# How long a fetched project list is reused before going back to GitHub
+_PROJECTS_CACHE_TTL = 30.0
+
+# Milestone lists are reused for a shorter window, since dashboards fetch
+# overdue and upcoming milestones back to back; the cache holds at most
+# _MILESTONES_CACHE_SIZE (status, sort, direction) combinations
+_MILESTONES_CACHE_TTL = 15.0
+_MILESTONES_CACHE_SIZE = 16
+
+# Single projects and issues looked up by ID are reused for this long; at
+# most _ENTITY_CACHE_SIZE of each are kept, oldest evicted first
+_ENTITY_CACHE_TTL = 30.0
+_ENTITY_CACHE_SIZE = 256
+
+# Most services ProjectManagementService.get keeps per event loop, least
+# recently used evicted (and closed) first
+_SERVICES_CACHE_SIZE = 128
+
+
+class MilestoneMetrics(TypedDict):
+    """Shape of the dict returned by get_milestone_metrics.
+    
+    Kept a plain dict at runtime so tool handlers can serialize it directly.
+    """
+    id: MilestoneId
+    title: str
+    due_date: Optional[str]
+    open_issues: int
+    closed_issues: int
+    total_issues: int
+    completion_percentage: float
+    status: str
+    issues: Optional[List[Dict[str, Any]]]
+    is_overdue: bool
+    days_remaining: Optional[int]
+
+
+class OverdueMilestoneMetrics(MilestoneMetrics):
+    """Milestone metrics as returned by get_overdue_milestones."""
+    days_overdue: int
+
+
+@lru_cache(maxsize=1024)
+def _parse_due(value: str) -> datetime:
+    """Parse a GitHub ISO-8601 date; dates without a timezone are taken as UTC.
+    
+    The same milestone due dates are parsed by every overdue/upcoming/metrics
+    call, so results are cached.
+    """
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _status_str(status: Any) -> str:
+    """Status as a plain string: the enum value, or str() of anything else."""
+    return status.value if isinstance(status, Enum) else str(status)
+
+
+def _issue_to_dict(issue: Any) -> Dict[str, Any]:
+    """Convert an issue to a plain dict for metrics responses."""
+    if is_dataclass(issue):
+        return asdict(issue)
+    elif hasattr(issue, '__dict__'):
+        return issue.__dict__
+    else:
+        # Fallback: create dict manually
+        return {
+            'id': getattr(issue, 'id', ''),
+            'number': getattr(issue, 'number', 0),
+            'title': getattr(issue, 'title', ''),
+            'description': getattr(issue, 'description', ''),
+            'status': _status_str(getattr(issue, 'status', '')),
+            'assignees': getattr(issue, 'assignees', []),
+            'labels': getattr(issue, 'labels', []),
+            'milestone_id': getattr(issue, 'milestone_id', None),
+            'created_at': getattr(issue, 'created_at', ''),
+            'updated_at': getattr(issue, 'updated_at', ''),
+            'url': getattr(issue, 'url', ''),
+        }
+
+
+def _summarize_issues(
+    issues: List[Issue],
+    include_issues: bool
+) -> Tuple[int, int, Optional[List[Dict[str, Any]]]]:
+    """Count open and closed issues, and convert them to dicts if requested.
+    
+    Returns:
+        (open_count, closed_count, issue dicts or None)
+    """
+    # Enum members are singletons and issue statuses are always built from
+    # ResourceStatus, so identity checks are safe (and skip str.__eq__)
+    active = ResourceStatus.ACTIVE
+    closed = ResourceStatus.CLOSED
+    open_count = closed_count = 0
+    issues_dict = [] if include_issues and issues else None
+    for issue in issues:
+        status = issue.status
+        if status is active:
+            open_count += 1
+        elif status is closed:
+            closed_count += 1
+        if issues_dict is not None:
+            issues_dict.append(_issue_to_dict(issue))
+    return open_count, closed_count, issues_dict
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Dataclass field names of cls, looked up once per type."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _set_fields(obj: Any) -> Dict[str, Any]:
+    """Shallow dict of a dataclass's fields, leaving out those that are None."""
+    values = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if value is not None:
+            values[name] = value
+    return values
+
+
+def _cache_get(cache: Dict[Any, Tuple[float, Any]], key: Any) -> Any:
+    """Return the cached value for key if it hasn't expired, else None."""
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any) -> None:
+    """Cache value under key for _ENTITY_CACHE_TTL seconds."""
+    cache.pop(key, None)
+    cache[key] = (time.monotonic() + _ENTITY_CACHE_TTL, value)
+    if len(cache) > _ENTITY_CACHE_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del cache[next(iter(cache))]
 
 
 class ProjectManagementService:
     """Project management service."""
     
+    __slots__ = (
+        '_factory',
+        '_logger',
+        '_issue_repo',
+        '_milestone_repo',
+        '_project_repo',
+        '_sprint_repo',
+        '_projects_cache',
+        '_projects_lock',
+        '_milestones_cache',
+        '_project_cache',
+        '_issue_cache',
+        '_inflight',
+    )
+    
+    # event loop -> (owner, repo, sha256 of token) -> shared service, oldest
+    # first; a loop's services go away with the loop
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict[Tuple[str, str, str], ProjectManagementService]]" = weakref.WeakKeyDictionary()
+    _instances_lock = threading.Lock()
+    
     def __init__(self, owner: str, repo: str, token: str):
         """Initialize project management service."""
         self._factory = GitHubRepositoryFactory(token, owner, repo)
+        self._logger = get_logger(self.__class__.__name__)
+        # Repositories are cheap to build (no requests are made), so they are
+        # created up front and read as plain attributes
+        self._issue_repo: GitHubIssueRepository = self._factory.create_issue_repository()
+        self._milestone_repo: GitHubMilestoneRepository = self._factory.create_milestone_repository()
+        self._project_repo: GitHubProjectRepository = self._factory.create_project_repository()
+        self._sprint_repo: GitHubSprintRepository = self._factory.create_sprint_repository()
+        # (fetched_at, projects) from the last unfiltered find_all; the lock
+        # makes concurrent misses share a single fetch
+        self._projects_cache: Optional[Tuple[float, List[Project]]] = None
+        self._projects_lock = asyncio.Lock()
+        # (status, sort, direction) -> (fetched_at, milestones), oldest first
+        self._milestones_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, List[Milestone]]]" = OrderedDict()
+        # id -> (expires_at, entity) for get_project / get_issue
+        self._project_cache: Dict[ProjectId, Tuple[float, Project]] = {}
+        self._issue_cache: Dict[IssueId, Tuple[float, Issue]] = {}
+        # (kind, id) -> task for lookups currently in flight, see _singleflight
+        self._inflight: Dict[Tuple[str, Any], "asyncio.Task[Any]"] = {}
+    
+    @classmethod
+    def get(cls, owner: str, repo: str, token: str) -> "ProjectManagementService":
+        """Get a shared service for owner/repo/token, creating it on first use.
+        
+        Reusing the service keeps its HTTP connection pool and caches warm
+        across requests. A service holds state bound to one event loop (its
+        lock, in-flight tasks and HTTP client), so services are shared per
+        running loop; called outside a loop, this returns a new, unshared
+        service. The token is keyed by its hash so the raw secret isn't held
+        in the cache key. Evicted services aren't closed, as callers may
+        still hold them; whoever holds a service closes it with aclose().
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return cls(owner, repo, token)
+        
+        key = (owner, repo, hashlib.sha256(token.encode()).hexdigest())
+        with cls._instances_lock:
+            instances = cls._instances.get(loop)
+            if instances is None:
+                instances = cls._instances[loop] = OrderedDict()
+            service = instances.get(key)
+            if service is not None:
+                instances.move_to_end(key)
+                return service
+            
+            service = cls(owner, repo, token)
+            instances[key] = service
+            if len(instances) > _SERVICES_CACHE_SIZE:
+                instances.popitem(last=False)
+            return service
     
     def get_repository_factory(self) -> GitHubRepositoryFactory:
         """Get the repository factory instance."""
         return self._factory
     
-    @property
-    def _issue_repo(self) -> GitHubIssueRepository:
-        """Get issue repository."""
-        return self._factory.create_issue_repository()
-    
-    @property
-    def _milestone_repo(self) -> GitHubMilestoneRepository:
-        """Get milestone repository."""
-        return self._factory.create_milestone_repository()
-    
-    @property
-    def _project_repo(self) -> GitHubProjectRepository:
-        """Get project repository."""
-        return self._factory.create_project_repository()
-    
-    @property
-    def _sprint_repo(self) -> GitHubSprintRepository:
-        """Get sprint repository."""
-        return self._factory.create_sprint_repository()
+    async def aclose(self) -> None:
+        """Release the repositories' shared HTTP connections."""
+        await self._factory.aclose()
+    
+    @staticmethod
+    def _require_id(data: Dict[str, Any], *keys: str, label: str = "ID") -> Any:
+        """Return the first non-empty value among keys, or raise ValueError."""
+        for key in keys:
+            value = data.get(key)
+            if value:
+                return value
+        raise ValueError(f"{label} is required")
+    
+    async def _singleflight(self, key: Tuple[str, Any], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch, sharing its result with concurrent callers for the same key.
+        
+        Only one request per key is in flight at a time; callers arriving
+        while it runs await the same task. The task is shielded so one
+        caller being cancelled doesn't cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
     
     # Project methods
     async def create_project(self, data: CreateProject) -> Project:
         """Create a project."""
-        return await self._project_repo.create(data)
+        try:
+            return await self._project_repo.create(data)
+        finally:
+            # After the write, so a listing racing it can't re-cache stale data
+            self._projects_cache = None
+    
+    def _cached_projects(self) -> Optional[List[Project]]:
+        """The last fetched project list, if it is still fresh."""
+        cache = self._projects_cache
+        if cache is not None and time.monotonic() - cache[0] < _PROJECTS_CACHE_TTL:
+            return cache[1]
+        return None
+    
+    async def _get_all_projects(self) -> List[Project]:
+        """Get all projects, reusing a recent fetch when there is one."""
+        projects = self._cached_projects()
+        if projects is not None:
+            return projects
+        
+        async with self._projects_lock:
+            # Another caller may have refreshed the cache while we waited
+            projects = self._cached_projects()
+            if projects is None:
+                projects = await self._project_repo.find_all()
+                self._projects_cache = (time.monotonic(), projects)
+            return projects
     
     async def list_projects(self, status: Optional[ResourceStatus] = None, limit: Optional[int] = None) -> List[Project]:
         """List projects."""
-        projects = await self._project_repo.find_all()
         if status:
-            projects = [p for p in projects if p.status == status]
-        if limit:
-            projects = projects[:limit]
-        return projects
+            # Normalize plain strings to the member so identity checks hold
+            status = ResourceStatus(status)
+        
+        # Filtered listings share the one cached fetch of all projects, so
+        # e.g. listing active then closed projects makes a single request
+        projects = await self._get_all_projects()
+        
+        # Filter and cap in one pass, stopping as soon as the limit is met;
+        # the result is a new list, so callers can't modify the cached one
+        result = []
+        for project in projects:
+            if status and project.status is not status:
+                continue
+            result.append(project)
+            if limit and len(result) >= limit:
+                break
+        return result
     
     async def get_project(self, project_id: ProjectId) -> Project:
         """Get a project."""
-        project = await self._project_repo.find_by_id(project_id)
+        project = _cache_get(self._project_cache, project_id)
+        if project is not None:
+            return project
+        project = await self._singleflight(
+            ('project', project_id), lambda: self._project_repo.find_by_id(project_id)
+        )
         if not project:
             raise ValueError(f"Project {project_id} not found")
+        _cache_put(self._project_cache, project_id, project)
         return project
     
     async def update_project(self, data: Dict[str, Any]) -> Project:
         """Update a project."""
-        project_id = data.get('project_id') or data.get('id')
-        if not project_id:
-            raise ValueError("Project ID is required")
-        return await self._project_repo.update(project_id, data)
+        project_id = self._require_id(data, 'project_id', 'id', label="Project ID")
+        try:
+            return await self._project_repo.update(project_id, data)
+        finally:
+            # After the write, so a read racing it can't re-cache stale data
+            self._projects_cache = None
+            self._project_cache.pop(project_id, None)
     
     async def delete_project(self, data: Dict[str, Any]) -> None:
         """Delete a project."""
-        project_id = data.get('project_id') or data.get('id')
-        if not project_id:
-            raise ValueError("Project ID is required")
-        await self._project_repo.delete(project_id)
+        project_id = self._require_id(data, 'project_id', 'id', label="Project ID")
+        try:
+            await self._project_repo.delete(project_id)
+        finally:
+            self._projects_cache = None
+            self._project_cache.pop(project_id, None)
     
     # Issue methods
     async def create_issue(self, data: CreateIssue) -> Issue:
@@ -103,22 +387,67 @@ class ProjectManagementService:
     
     async def list_issues(self, options: Optional[Dict[str, Any]] = None) -> List[Issue]:
         """List issues."""
-        return await self._issue_repo.find_all(options)
+        return [issue async for issue in self.iter_issues(options)]
+    
+    async def list_issues_batched(self, option_sets: List[Optional[Dict[str, Any]]]) -> List[List[Issue]]:
+        """Run several issue listings at once, one result list per option set.
+        
+        Option sets are sent GitHubIssueRepository.MAX_BATCH_QUERIES at a time
+        as aliased GraphQL queries, with the chunks fetched concurrently.
+        """
+        size = self._issue_repo.MAX_BATCH_QUERIES
+        chunks = await asyncio.gather(*(
+            self._issue_repo.find_all_batched(option_sets[start:start + size])
+            for start in range(0, len(option_sets), size)
+        ))
+        return [issues for chunk in chunks for issues in chunk]
+    
+    async def iter_issues(self, options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Issue]:
+        """Iterate over issues, fetching the next page while the current one is consumed."""
+        pages = self._issue_repo.find_pages(options)
+        next_page = asyncio.ensure_future(anext(pages))
+        try:
+            while True:
+                try:
+                    page = await next_page
+                except StopAsyncIteration:
+                    return
+                next_page = asyncio.ensure_future(anext(pages))
+                for issue in page:
+                    yield issue
+        finally:
+            # The caller stopped early: drop the prefetched page, whatever its outcome
+            next_page.cancel()
+            try:
+                await next_page
+            except (asyncio.CancelledError, Exception):
+                pass
+            await pages.aclose()
     
     async def get_issue(self, issue_id: IssueId) -> Issue:
         """Get an issue."""
-        issue = await self._issue_repo.find_by_id(issue_id)
+        issue = _cache_get(self._issue_cache, issue_id)
+        if issue is not None:
+            return issue
+        issue = await self._singleflight(
+            ('issue', issue_id), lambda: self._issue_repo.find_by_id(issue_id)
+        )
         if not issue:
             raise ValueError(f"Issue {issue_id} not found")
+        _cache_put(self._issue_cache, issue_id, issue)
         return issue
     
     async def update_issue(self, issue_id: IssueId, data: Dict[str, Any]) -> Issue:
         """Update an issue."""
-        issue = await self._issue_repo.update(issue_id, data)
+        try:
+            issue = await self._issue_repo.update(issue_id, data)
+        finally:
+            self._issue_cache.pop(issue_id, None)
         
         # If status is "in_progress", also try to update project item Status field
         if data.get("status") == ResourceStatus.ACTIVE and data.get("_add_in_progress_label"):
-            # Try to update project item Status field if issue is in a project
+            # Only once the issue update has succeeded, so the board never
+            # runs ahead of the issue
             await self._try_update_project_item_status(issue_id, "in_progress")
         
         return issue
@@ -184,29 +513,21 @@ class ProjectManagementService:
     async def _try_update_project_item_status(self, issue_id: IssueId, status_value: str) -> None:
         """Try to update project item Status field for an issue."""
         try:
-            # Get all projects
-            projects = await self.list_projects()
-            
-            for project in projects:
-                # Get project item ID for this issue
-                item_id = await self._project_repo.get_project_item_id_for_issue(project.id, issue_id)
-                if item_id:
-                    # Find Status field
-                    status_field = await self._project_repo.get_field_by_name(project.id, "Status")
-                    if status_field:
-                        # Update the field value
-                        await self._project_repo.set_field_value(
-                            project.id,
-                            item_id,
-                            status_field["id"],
-                            status_value
-                        )
-                        # Only update in the first project found
-                        break
+            # One query finds the issue's project item and that project's
+            # Status field, instead of scanning every project
+            match = await self._project_repo.find_project_item_with_field(issue_id, "Status")
+            if match:
+                # Only update in the first project found
+                await self._project_repo.set_field_value(
+                    match["project_id"],
+                    match["item_id"],
+                    match["field"]["id"],
+                    status_value,
+                    field=match["field"]
+                )
         except Exception as e:
             # Log but don't fail the issue update
-            if hasattr(self._logger, 'debug'):
-                self._logger.debug(f"Could not update project item status: {str(e)}")
+            self._logger.debug(f"Could not update project item status: {str(e)}")
     
     async def set_project_item_field_value(
         self,
@@ -221,169 +542,213 @@ class ProjectManagementService:
     # Milestone methods
     async def create_milestone(self, data: CreateMilestone) -> Milestone:
         """Create a milestone."""
-        return await self._milestone_repo.create(data)
+        try:
+            return await self._milestone_repo.create(data)
+        finally:
+            # After the write, so a listing racing it can't re-cache stale data
+            self._milestones_cache.clear()
     
     async def list_milestones(self, status: Optional[ResourceStatus] = None, sort: Optional[str] = None, direction: Optional[str] = None) -> List[Milestone]:
         """List milestones."""
-        options = {'status': status} if status else None
+        key = (status, sort, direction)
+        cached = self._milestones_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _MILESTONES_CACHE_TTL:
+            # A copy, so callers can't modify the cached list
+            return list(cached[1])
+        
+        options = {'status': status, 'sort': sort, 'direction': direction}
         milestones = await self._milestone_repo.find_all(options)
-        # TODO: Implement sorting
-        return milestones
+        
+        self._milestones_cache[key] = (time.monotonic(), milestones)
+        self._milestones_cache.move_to_end(key)
+        if len(self._milestones_cache) > _MILESTONES_CACHE_SIZE:
+            self._milestones_cache.popitem(last=False)
+        return list(milestones)
     
     async def update_milestone(self, data: Dict[str, Any]) -> Milestone:
         """Update a milestone."""
-        milestone_id = data.get('milestone_id') or data.get('id')
-        if not milestone_id:
-            raise ValueError("Milestone ID is required")
-        return await self._milestone_repo.update(milestone_id, data)
+        milestone_id = self._require_id(data, 'milestone_id', 'id', label="Milestone ID")
+        try:
+            return await self._milestone_repo.update(milestone_id, data)
+        finally:
+            self._milestones_cache.clear()
     
     async def delete_milestone(self, data: Dict[str, Any]) -> None:
         """Delete a milestone."""
-        milestone_id = data.get('milestone_id') or data.get('id')
-        if not milestone_id:
-            raise ValueError("Milestone ID is required")
-        await self._milestone_repo.delete(milestone_id)
+        milestone_id = self._require_id(data, 'milestone_id', 'id', label="Milestone ID")
+        try:
+            await self._milestone_repo.delete(milestone_id)
+        finally:
+            self._milestones_cache.clear()
     
-    async def get_milestone_metrics(self, milestone_id: MilestoneId, include_issues: bool = False) -> Dict[str, Any]:
+    async def get_milestone_metrics(self, milestone_id: MilestoneId, include_issues: bool = False) -> MilestoneMetrics:
         """Get milestone metrics."""
-        milestone = await self._milestone_repo.find_by_id(milestone_id)
+        issues = None
+        if include_issues:
+            # The issue listing is needed anyway, so fetch it alongside the milestone
+            milestone, issues = await asyncio.gather(
+                self._milestone_repo.find_by_id(milestone_id),
+                self._milestone_repo.get_issues(milestone_id)
+            )
+        else:
+            milestone = await self._milestone_repo.find_by_id(milestone_id)
         if not milestone:
             raise ValueError(f"Milestone {milestone_id} not found")
+        return await self._milestone_metrics(milestone, include_issues, issues)
+    
+    async def _milestone_metrics(
+        self,
+        milestone: Milestone,
+        include_issues: bool,
+        issues: Optional[List[Issue]] = None,
+        now: Optional[datetime] = None
+    ) -> MilestoneMetrics:
+        """Build metrics for an already fetched milestone.
         
-        issues = await self._milestone_repo.get_issues(milestone_id)
-        open_issues = [i for i in issues if i.status == ResourceStatus.ACTIVE]
-        closed_issues = [i for i in issues if i.status == ResourceStatus.CLOSED]
+        Listings pass a shared now so every milestone in them is measured
+        against the same instant.
+        """
+        if issues is None and not include_issues and milestone.progress:
+            # Counts alone come straight from the milestone's own counters,
+            # so the (paginated) issue listing can be skipped
+            open_count = milestone.progress['open_issues']
+            closed_count = milestone.progress['closed_issues']
+            issues_dict = None
+            total_issues = open_count + closed_count
+        else:
+            if issues is None:
+                issues = await self._milestone_repo.get_issues(milestone.id)
+            open_count, closed_count, issues_dict = _summarize_issues(issues, include_issues)
+            total_issues = len(issues)
         
-        total_issues = len(issues)
-        completion_percentage = (len(closed_issues) / total_issues * 100) if total_issues > 0 else 0
-        
-        # Convert issues to dictionaries if including them
-        issues_dict = None
-        if include_issues and issues:
-            from dataclasses import asdict
-            issues_dict = []
-            for issue in issues:
-                if hasattr(issue, '__dataclass_fields__'):
-                    issues_dict.append(asdict(issue))
-                elif hasattr(issue, '__dict__'):
-                    issues_dict.append(issue.__dict__)
-                else:
-                    # Fallback: create dict manually
-                    issues_dict.append({
-                        'id': getattr(issue, 'id', ''),
-                        'number': getattr(issue, 'number', 0),
-                        'title': getattr(issue, 'title', ''),
-                        'description': getattr(issue, 'description', ''),
-                        'status': getattr(issue, 'status', '').value if hasattr(getattr(issue, 'status', ''), 'value') else str(getattr(issue, 'status', '')),
-                        'assignees': getattr(issue, 'assignees', []),
-                        'labels': getattr(issue, 'labels', []),
-                        'milestone_id': getattr(issue, 'milestone_id', None),
-                        'created_at': getattr(issue, 'created_at', ''),
-                        'updated_at': getattr(issue, 'updated_at', ''),
-                        'url': getattr(issue, 'url', ''),
-                    })
+        completion_percentage = round(closed_count * 100.0 / total_issues, 2) if total_issues else 0.0
         
-        # Calculate days remaining
+        # Calculate days remaining; a closed milestone is never overdue
         days_remaining = None
         is_overdue = False
         try:
-            from datetime import datetime
             if milestone.due_date:
-                due_date = datetime.fromisoformat(milestone.due_date.replace('Z', '+00:00'))
-                now = datetime.now(due_date.tzinfo) if due_date.tzinfo else datetime.now()
-                days_remaining = (due_date - now).days
-                is_overdue = days_remaining < 0
-        except:
+                if now is None:
+                    now = datetime.now(timezone.utc)
+                days_remaining = (_parse_due(milestone.due_date) - now).days
+                is_overdue = days_remaining < 0 and milestone.status is not ResourceStatus.CLOSED
+        except (ValueError, TypeError, AttributeError):
             pass
         
         return {
             'id': milestone.id,
             'title': milestone.title,
             'due_date': milestone.due_date,
-            'open_issues': len(open_issues),
-            'closed_issues': len(closed_issues),
+            'open_issues': open_count,
+            'closed_issues': closed_count,
             'total_issues': total_issues,
-            'completion_percentage': round(completion_percentage, 2),
-            'status': milestone.status.value if hasattr(milestone.status, 'value') else str(milestone.status),
+            'completion_percentage': completion_percentage,
+            'status': _status_str(milestone.status),
             'issues': issues_dict,
             'is_overdue': is_overdue,
             'days_remaining': days_remaining
         }
     
-    async def get_overdue_milestones(self, limit: int, include_issues: bool = False) -> List[Dict[str, Any]]:
-        """Get overdue milestones."""
-        from datetime import datetime
+    async def _gather_milestone_metrics(
+        self,
+        milestones: List[Milestone],
+        include_issues: bool,
+        now: Optional[datetime] = None
+    ) -> List[Any]:
+        """Fetch metrics for several milestones concurrently.
         
+        Results are in input order; a failed fetch yields its exception in
+        place of the metrics dict.
+        """
+        semaphore = asyncio.Semaphore(_METRICS_CONCURRENCY)
+        
+        async def fetch(milestone: Milestone) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._milestone_metrics(milestone, include_issues, now=now)
+        
+        results = await asyncio.gather(
+            *(fetch(milestone) for milestone in milestones),
+            return_exceptions=True
+        )
+        # Cancellation and other non-Exception errors must not be swallowed
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
+    
+    async def get_overdue_milestones(self, limit: int, include_issues: bool = False) -> List[OverdueMilestoneMetrics]:
+        """Get overdue milestones."""
         # Get all active milestones
         all_milestones = await self.list_milestones(status=ResourceStatus.ACTIVE)
         
-        overdue_milestones = []
-        now = datetime.now()
+        overdue_milestones: List[OverdueMilestoneMetrics] = []
+        candidates = []
+        now = datetime.now(timezone.utc)
         
         for milestone in all_milestones:
             if not milestone.due_date:
                 continue
             
             try:
-                due_date = datetime.fromisoformat(milestone.due_date.replace('Z', '+00:00'))
-                days_overdue = (now - due_date).days
-                
-                if days_overdue > 0:  # Overdue
-                    # Get metrics for this milestone
-                    metrics = await self.get_milestone_metrics(milestone.id, include_issues)
-                    metrics['days_overdue'] = days_overdue
-                    overdue_milestones.append(metrics)
-            except:
+                days_overdue = (now - _parse_due(milestone.due_date)).days
+            except (ValueError, TypeError, AttributeError):
                 continue
+            
+            if days_overdue > 0:  # Overdue
+                candidates.append((milestone, days_overdue))
         
-        # Sort by days overdue (most overdue first)
-        overdue_milestones.sort(key=lambda x: x.get('days_overdue', 0), reverse=True)
+        # Fetch metrics for all overdue milestones concurrently
+        results = await self._gather_milestone_metrics(
+            [milestone for milestone, _ in candidates], include_issues, now
+        )
+        for (milestone, days_overdue), metrics in zip(candidates, results):
+            if isinstance(metrics, Exception):
+                continue
+            overdue_milestones.append(OverdueMilestoneMetrics(**metrics, days_overdue=days_overdue))
         
-        # Apply limit
-        return overdue_milestones[:limit]
+        # Most overdue first, keeping only the top `limit`
+        return heapq.nlargest(limit, overdue_milestones, key=itemgetter('days_overdue'))
     
-    async def get_upcoming_milestones(self, days_ahead: int, limit: int, include_issues: bool = False) -> List[Dict[str, Any]]:
+    async def get_upcoming_milestones(self, days_ahead: int, limit: int, include_issues: bool = False) -> List[MilestoneMetrics]:
         """Get upcoming milestones."""
-        from datetime import datetime, timedelta
-        
         # Get all active milestones
         all_milestones = await self.list_milestones(status=ResourceStatus.ACTIVE)
         
         upcoming_milestones = []
-        now = datetime.now()
+        candidates = []
+        now = datetime.now(timezone.utc)
         
         for milestone in all_milestones:
             if not milestone.due_date:
                 continue
             
             try:
-                # Parse due date - handle both Z and +00:00 formats
-                due_date_str = milestone.due_date.replace('Z', '+00:00')
-                # If it doesn't have timezone info, add UTC
-                if '+' not in due_date_str and 'Z' not in due_date_str:
-                    due_date_str += '+00:00'
-                
-                due_date = datetime.fromisoformat(due_date_str)
-                days_remaining = (due_date - now).days
-                
-                # Check if milestone is upcoming (due date is in the future and within the specified days ahead)
-                # Include milestones that are due today (0 days) up to days_ahead days in the future
-                if 0 <= days_remaining <= days_ahead:
-                    # Get metrics for this milestone
-                    metrics = await self.get_milestone_metrics(milestone.id, include_issues)
-                    metrics['days_remaining'] = days_remaining
-                    upcoming_milestones.append(metrics)
-            except Exception as e:
+                # Handles both Z and +00:00 suffixes; no timezone means UTC
+                days_remaining = (_parse_due(milestone.due_date) - now).days
+            except (ValueError, TypeError, AttributeError) as e:
                 # Log error but continue
-                if hasattr(self._logger, 'debug'):
-                    self._logger.debug(f"Error processing milestone {milestone.id}: {str(e)}")
+                self._logger.debug(f"Error processing milestone {milestone.id}: {str(e)}")
                 continue
+            
+            # Check if milestone is upcoming (due date is in the future and within the specified days ahead)
+            # Include milestones that are due today (0 days) up to days_ahead days in the future
+            if 0 <= days_remaining <= days_ahead:
+                candidates.append((milestone, days_remaining))
         
-        # Sort by days remaining (soonest first)
-        upcoming_milestones.sort(key=lambda x: x.get('days_remaining', 999))
+        # Fetch metrics for all upcoming milestones concurrently
+        results = await self._gather_milestone_metrics(
+            [milestone for milestone, _ in candidates], include_issues, now
+        )
+        for (milestone, days_remaining), metrics in zip(candidates, results):
+            if isinstance(metrics, Exception):
+                # Log error but continue
+                self._logger.debug(f"Error processing milestone {milestone.id}: {str(metrics)}")
+                continue
+            metrics['days_remaining'] = days_remaining
+            upcoming_milestones.append(metrics)
         
-        # Apply limit
-        return upcoming_milestones[:limit]
+        # Soonest first, keeping only the top `limit`
+        return heapq.nsmallest(limit, upcoming_milestones, key=itemgetter('days_remaining'))
     
     # Sprint methods
     async def create_sprint(self, data: CreateSprint, project_id: Optional[ProjectId] = None) -> Sprint:
@@ -397,23 +762,39 @@ class ProjectManagementService:
     
     async def get_current_sprint(self, include_issues: bool = False) -> Optional[Sprint]:
         """Get current sprint."""
-        return await self._sprint_repo.find_current()
+        return await self._singleflight(('current_sprint', None), self._sprint_repo.find_current)
+    
+    async def get_dashboard(
+        self,
+        milestone_status: Optional[ResourceStatus] = None,
+        issue_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Get milestones, issues and the current sprint in one call.
+        
+        The three lookups are independent, so they are fetched concurrently.
+        """
+        milestones, issues, current_sprint = await asyncio.gather(
+            self.list_milestones(status=milestone_status),
+            self.list_issues(issue_options),
+            self.get_current_sprint()
+        )
+        return {
+            'milestones': milestones,
+            'issues': issues,
+            'current_sprint': current_sprint,
+        }
     
     async def update_sprint(self, data: Dict[str, Any]) -> Sprint:
         """Update a sprint."""
-        sprint_id = data.get('id')
-        if not sprint_id:
-            raise ValueError("Sprint ID is required")
+        sprint_id = self._require_id(data, 'id', label="Sprint ID")
         return await self._sprint_repo.update(sprint_id, data)
     
     async def plan_sprint(self, data: Dict[str, Any]) -> Sprint:
         """Plan a sprint - creates a sprint with issues."""
-        from ...domain.types import CreateSprint as DomainCreateSprint
-        
         sprint_data = data.get("sprint", {})
         issue_ids = data.get("issue_ids", [])
         
-        create_sprint = DomainCreateSprint(
+        create_sprint = CreateSprint(
             title=sprint_data.get("title", ""),
             description=sprint_data.get("description", ""),
             start_date=sprint_data.get("start_date", ""),
@@ -438,62 +819,25 @@ class ProjectManagementService:
         except NotImplementedError:
             # If get_issues is not implemented, try to get issues from sprint.issues if available
             if hasattr(sprint, 'issues') and sprint.issues:
-                from .github_issue_repository import GitHubIssueRepository
-                issue_repo = GitHubIssueRepository(self._github, self._repo, self._config)
-                issues = []
-                for issue_id in sprint.issues:
-                    try:
-                        issue = await issue_repo.find_by_id(issue_id)
-                        if issue:
-                            issues.append(issue)
-                    except:
-                        continue
+                issues = await self._issue_repo.find_by_ids(sprint.issues)
             else:
                 issues = []
         
-        open_issues = [i for i in issues if i.status == ResourceStatus.ACTIVE]
-        closed_issues = [i for i in issues if i.status == ResourceStatus.CLOSED]
+        open_count, closed_count, issues_dict = _summarize_issues(issues, include_issues)
         
         total_issues = len(issues)
-        completion_percentage = (len(closed_issues) / total_issues * 100) if total_issues > 0 else 0
+        completion_percentage = round(closed_count * 100.0 / total_issues, 2) if total_issues else 0.0
         
         # Calculate days remaining
         days_remaining = None
         try:
-            from datetime import datetime
             if sprint.end_date:
                 end_date = datetime.fromisoformat(sprint.end_date.replace('Z', '+00:00'))
                 now = datetime.now(end_date.tzinfo) if end_date.tzinfo else datetime.now()
                 days_remaining = (end_date - now).days
-        except:
+        except (ValueError, TypeError, AttributeError):
             pass
         
-        # Convert issues to dictionaries if including them
-        issues_dict = None
-        if include_issues and issues:
-            from dataclasses import asdict
-            issues_dict = []
-            for issue in issues:
-                if hasattr(issue, '__dataclass_fields__'):
-                    issues_dict.append(asdict(issue))
-                elif hasattr(issue, '__dict__'):
-                    issues_dict.append(issue.__dict__)
-                else:
-                    # Fallback: create dict manually
-                    issues_dict.append({
-                        'id': getattr(issue, 'id', ''),
-                        'number': getattr(issue, 'number', 0),
-                        'title': getattr(issue, 'title', ''),
-                        'description': getattr(issue, 'description', ''),
-                        'status': getattr(issue, 'status', '').value if hasattr(getattr(issue, 'status', ''), 'value') else str(getattr(issue, 'status', '')),
-                        'assignees': getattr(issue, 'assignees', []),
-                        'labels': getattr(issue, 'labels', []),
-                        'milestone_id': getattr(issue, 'milestone_id', None),
-                        'created_at': getattr(issue, 'created_at', ''),
-                        'updated_at': getattr(issue, 'updated_at', ''),
-                        'url': getattr(issue, 'url', ''),
-                    })
-        
         return {
             'sprint': {
                 'id': sprint.id,
@@ -501,19 +845,22 @@ class ProjectManagementService:
                 'description': sprint.description,
                 'start_date': sprint.start_date,
                 'end_date': sprint.end_date,
-                'status': sprint.status.value if hasattr(sprint.status, 'value') else str(sprint.status),
+                'status': _status_str(sprint.status),
             },
-            'open_issues': len(open_issues),
-            'closed_issues': len(closed_issues),
+            'open_issues': open_count,
+            'closed_issues': closed_count,
             'total_issues': total_issues,
-            'completion_percentage': round(completion_percentage, 2),
+            'completion_percentage': completion_percentage,
             'days_remaining': days_remaining,
             'issues': issues_dict,
         }
     
     async def add_issue_to_sprint(self, sprint_id: SprintId, issue_id: IssueId) -> Sprint:
         """Add an issue to a sprint."""
-        return await self._sprint_repo.add_issue(sprint_id, issue_id)
+        try:
+            return await self._sprint_repo.add_issue(sprint_id, issue_id)
+        finally:
+            self._issue_cache.pop(issue_id, None)
     
     async def create_roadmap(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a roadmap."""
@@ -524,46 +871,51 @@ class ProjectManagementService:
     # Field methods
     async def create_field(self, project_id: ProjectId, field: CreateField) -> CustomField:
         """Create a field."""
-        return await self._project_repo.create_field(project_id, field.__dict__)
+        try:
+            return await self._project_repo.create_field(project_id, _set_fields(field))
+        finally:
+            self._project_cache.pop(project_id, None)
     
     async def update_field(self, project_id: ProjectId, field_id: str, data: UpdateField) -> CustomField:
         """Update a field."""
-        return await self._project_repo.update_field(project_id, field_id, data.__dict__)
+        try:
+            return await self._project_repo.update_field(project_id, field_id, _set_fields(data))
+        finally:
+            self._project_cache.pop(project_id, None)
     
     async def list_project_fields(self, data: Dict[str, Any]) -> List[CustomField]:
         """List project fields."""
-        project_id = data.get('projectId')
-        if not project_id:
-            raise ValueError("Project ID is required")
-        project = await self.get_project(project_id)
-        return project.fields
+        project_id = self._require_id(data, 'projectId', label="Project ID")
+        return await self._project_repo.list_fields(project_id)
     
     # View methods
     async def create_view(self, project_id: ProjectId, name: str, layout: str) -> ProjectView:
         """Create a view."""
-        return await self._project_repo.create_view(project_id, name, layout)
+        try:
+            return await self._project_repo.create_view(project_id, name, layout)
+        finally:
+            self._project_cache.pop(project_id, None)
     
     async def list_project_views(self, data: Dict[str, Any]) -> List[ProjectView]:
         """List project views."""
-        project_id = data.get('projectId')
-        if not project_id:
-            raise ValueError("Project ID is required")
-        project = await self.get_project(project_id)
-        return project.views or []
+        project_id = self._require_id(data, 'projectId', label="Project ID")
+        return await self._project_repo.list_views(project_id)
     
     async def update_project_view(self, data: Dict[str, Any]) -> ProjectView:
         """Update a project view."""
-        project_id = data.get('projectId')
-        view_id = data.get('viewId')
-        if not project_id or not view_id:
-            raise ValueError("Project ID and View ID are required")
-        return await self._project_repo.update_view(project_id, view_id, data)
+        project_id = self._require_id(data, 'projectId', label="Project ID")
+        view_id = self._require_id(data, 'viewId', label="View ID")
+        try:
+            return await self._project_repo.update_view(project_id, view_id, data)
+        finally:
+            self._project_cache.pop(project_id, None)
     
     async def delete_project_view(self, data: Dict[str, Any]) -> None:
         """Delete a project view."""
-        project_id = data.get('projectId')
-        view_id = data.get('viewId')
-        if not project_id or not view_id:
-            raise ValueError("Project ID and View ID are required")
-        await self._project_repo.delete_view(project_id, view_id)
+        project_id = self._require_id(data, 'projectId', label="Project ID")
+        view_id = self._require_id(data, 'viewId', label="View ID")
+        try:
+            await self._project_repo.delete_view(project_id, view_id)
+        finally:
+            self._project_cache.pop(project_id, None)
 
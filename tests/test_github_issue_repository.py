@@ -0,0 +1,107 @@
+"""Tests for the GitHub issue repository's batched GraphQL queries."""
+
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.github.repositories.github_issue_repository import (
+    GitHubIssueRepository,
+    _ISSUE_FIELDS_FRAGMENT,
+)
+
+# GitHub rejects GraphQL queries that could return more nodes than this
+GITHUB_NODE_LIMIT = 500_000
+
+
+def _inline_fragment(query: str) -> str:
+    """Replace ...IssueFields spreads with the fragment's selection set."""
+    body = _ISSUE_FIELDS_FRAGMENT.strip()
+    selection = body[body.index("{") + 1:body.rindex("}")]
+    query = query.replace(_ISSUE_FIELDS_FRAGMENT, "")
+    return query.replace("...IssueFields", selection)
+
+
+def _node_cost(query: str) -> int:
+    """Worst-case node count of a query, as GitHub computes it.
+
+    Every connection costs its first: value times the first: values of the
+    connections it is nested in.
+    """
+    total = 0
+    multipliers = [1]
+    pending_first = None
+    paren_depth = 0
+    for match in re.finditer(r"first:\s*(\d+)|[(){}]", query):
+        token = match.group(0)
+        if match.group(1):
+            pending_first = int(match.group(1))
+        elif token == "(":
+            paren_depth += 1
+        elif token == ")":
+            paren_depth -= 1
+        elif paren_depth:
+            # Braces inside arguments (e.g. orderBy: {...}) aren't selections
+            continue
+        elif token == "{":
+            if pending_first:
+                multiplier = multipliers[-1] * pending_first
+                total += multiplier
+                pending_first = None
+            else:
+                multiplier = multipliers[-1]
+            multipliers.append(multiplier)
+        else:
+            multipliers.pop()
+    return total
+
+
+def _repository_capturing_queries(queries: list) -> GitHubIssueRepository:
+    """An issue repository whose GraphQL calls are recorded, not sent."""
+    repository = GitHubIssueRepository.__new__(GitHubIssueRepository)
+    repository._config = SimpleNamespace(owner="owner", repo="repo")
+
+    async def graphql(query, variables=None, nullable_errors=()):
+        queries.append(query)
+        return {"repository": {}}
+
+    repository.graphql = graphql
+    return repository
+
+
+def test_node_cost_counts_nested_connections():
+    """Nested connections multiply; argument braces are ignored."""
+    query = """
+    query {
+      repository(owner: "o", name: "r") {
+        issues(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { labels(first: 5) { nodes { name } } }
+        }
+      }
+    }
+    """
+    assert _node_cost(query) == 10 + 10 * 5
+
+
+def test_full_batch_stays_under_github_node_limit():
+    """A full find_all_batched chunk must not exceed GitHub's node limit."""
+    queries = []
+    repository = _repository_capturing_queries(queries)
+    option_sets = [{"labels": ["bug"]}] * GitHubIssueRepository.MAX_BATCH_QUERIES
+
+    asyncio.run(repository.find_all_batched(option_sets))
+
+    assert len(queries) == 1
+    assert _node_cost(_inline_fragment(queries[0])) <= GITHUB_NODE_LIMIT
+
+
+def test_oversized_batch_is_rejected():
+    """More option sets than MAX_BATCH_QUERIES raise instead of querying."""
+    queries = []
+    repository = _repository_capturing_queries(queries)
+    option_sets = [None] * (GitHubIssueRepository.MAX_BATCH_QUERIES + 1)
+
+    with pytest.raises(ValueError):
+        asyncio.run(repository.find_all_batched(option_sets))
+    assert queries == []